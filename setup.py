@@ -5,22 +5,25 @@ import pathlib
 
 from setuptools import setup, find_packages
 
-version, author, author_email = (
-    re.search(
-        rf'__{name}__ = \'(.*?)\'',
-        pathlib.Path('webvtt/__init__.py').read_text()
-        ).group(1)
-    for name in ('version', 'author', 'author_email')
-    )
+METADATA_PATTERN = re.compile(r"__(version|author|author_email)__ = '(.*?)'")
+
+metadata = {}
+with open('webvtt/__init__.py', encoding='utf-8') as f:
+    for line in f:
+        match = METADATA_PATTERN.match(line)
+        if match:
+            metadata[match.group(1)] = match.group(2)
+            if len(metadata) == 3:
+                break
 
 setup(
     name='webvtt-py',
-    version=version,
+    version=metadata['version'],
     description='WebVTT reader, writer and segmenter',
     long_description=pathlib.Path('README.rst').read_text(),
     long_description_content_type='text/x-rst',
-    author=author,
-    author_email=author_email,
+    author=metadata['author'],
+    author_email=metadata['author_email'],
     url='https://github.com/glut23/webvtt-py',
     packages=find_packages('.', exclude=['tests']),
     include_package_data=True,
@@ -6,177 +6,180 @@ import textwrap
 
 from webvtt.cli import main
 
+PATH_TO_SAMPLES = pathlib.Path(__file__).resolve().parent / 'samples'
+
+# keep the segmenter output in memory when a tmpfs is available
+TEMP_ROOT = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+
+_EXPECTED_INDEX = textwrap.dedent(
+    '''
+    #EXTM3U
+    #EXT-X-TARGETDURATION:10
+    #EXT-X-VERSION:3
+    #EXT-X-PLAYLIST-TYPE:VOD
+    #EXTINF:30.00000
+    fileSequence0.webvtt
+    #EXTINF:30.00000
+    fileSequence1.webvtt
+    #EXTINF:30.00000
+    fileSequence2.webvtt
+    #EXTINF:30.00000
+    fileSequence3.webvtt
+    #EXTINF:30.00000
+    fileSequence4.webvtt
+    #EXTINF:30.00000
+    fileSequence5.webvtt
+    #EXTINF:30.00000
+    fileSequence6.webvtt
+    #EXT-X-ENDLIST
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ0 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:00.500 --> 00:00:07.000
+    Caption text #1
+
+    00:00:07.000 --> 00:00:11.890
+    Caption text #2
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ1 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:07.000 --> 00:00:11.890
+    Caption text #2
+
+    00:00:11.890 --> 00:00:16.320
+    Caption text #3
+
+    00:00:16.320 --> 00:00:21.580
+    Caption text #4
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ2 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:16.320 --> 00:00:21.580
+    Caption text #4
+
+    00:00:21.580 --> 00:00:23.880
+    Caption text #5
+
+    00:00:23.880 --> 00:00:27.280
+    Caption text #6
+
+    00:00:27.280 --> 00:00:30.280
+    Caption text #7
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ3 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:27.280 --> 00:00:30.280
+    Caption text #7
+
+    00:00:30.280 --> 00:00:36.510
+    Caption text #8
+
+    00:00:36.510 --> 00:00:38.870
+    Caption text #9
+
+    00:00:38.870 --> 00:00:45.000
+    Caption text #10
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ4 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:38.870 --> 00:00:45.000
+    Caption text #10
+
+    00:00:45.000 --> 00:00:47.000
+    Caption text #11
+
+    00:00:47.000 --> 00:00:50.970
+    Caption text #12
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ5 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:47.000 --> 00:00:50.970
+    Caption text #12
+
+    00:00:50.970 --> 00:00:54.440
+    Caption text #13
+
+    00:00:54.440 --> 00:00:58.600
+    Caption text #14
+
+    00:00:58.600 --> 00:01:01.350
+    Caption text #15
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_SEQ6 = textwrap.dedent(
+    '''
+    WEBVTT
+    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+    00:00:58.600 --> 00:01:01.350
+    Caption text #15
+
+    00:01:01.350 --> 00:01:04.300
+    Caption text #16
+    '''
+    ).lstrip().encode('ascii')
+
+_EXPECTED_FILES = {
+    'prog_index.m3u8': _EXPECTED_INDEX,
+    'fileSequence0.webvtt': _EXPECTED_SEQ0,
+    'fileSequence1.webvtt': _EXPECTED_SEQ1,
+    'fileSequence2.webvtt': _EXPECTED_SEQ2,
+    'fileSequence3.webvtt': _EXPECTED_SEQ3,
+    'fileSequence4.webvtt': _EXPECTED_SEQ4,
+    'fileSequence5.webvtt': _EXPECTED_SEQ5,
+    'fileSequence6.webvtt': _EXPECTED_SEQ6,
+    }
+
 
 class CLITestCase(unittest.TestCase):
 
     def test_cli(self):
-        vtt_file = (
-            pathlib.Path(__file__).resolve().parent
-            / 'samples' / 'sample.vtt'
-            )
+        vtt_file = PATH_TO_SAMPLES / 'sample.vtt'
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as temp_dir:
 
-            main(['segment', str(vtt_file.resolve()), '-o', temp_dir])
-            _, dirs, files = next(os.walk(temp_dir))
+            main(['segment', str(vtt_file), '-o', temp_dir])
+            dirs, files = [], []
+            for entry in os.scandir(temp_dir):
+                (dirs if entry.is_dir() else files).append(entry.name)
 
             self.assertEqual(len(dirs), 0)
-            self.assertEqual(len(files), 8)
-            for expected_file in ('prog_index.m3u8',
-                                  'fileSequence0.webvtt',
-                                  'fileSequence1.webvtt',
-                                  'fileSequence2.webvtt',
-                                  'fileSequence3.webvtt',
-                                  'fileSequence4.webvtt',
-                                  'fileSequence5.webvtt',
-                                  'fileSequence6.webvtt',
-                                  ):
-                self.assertIn(expected_file, files)
-
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'prog_index.m3u8').read_text(),
-                textwrap.dedent(
-                '''
-                #EXTM3U
-                #EXT-X-TARGETDURATION:10
-                #EXT-X-VERSION:3
-                #EXT-X-PLAYLIST-TYPE:VOD
-                #EXTINF:30.00000
-                fileSequence0.webvtt
-                #EXTINF:30.00000
-                fileSequence1.webvtt
-                #EXTINF:30.00000
-                fileSequence2.webvtt
-                #EXTINF:30.00000
-                fileSequence3.webvtt
-                #EXTINF:30.00000
-                fileSequence4.webvtt
-                #EXTINF:30.00000
-                fileSequence5.webvtt
-                #EXTINF:30.00000
-                fileSequence6.webvtt
-                #EXT-X-ENDLIST
-                '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence0.webvtt').read_text(),
-                textwrap.dedent(
-                '''
-                WEBVTT
-                X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                00:00:00.500 --> 00:00:07.000
-                Caption text #1
-
-                00:00:07.000 --> 00:00:11.890
-                Caption text #2
-                '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence1.webvtt').read_text(),
-                textwrap.dedent(
-                    '''
-                    WEBVTT
-                    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                    00:00:07.000 --> 00:00:11.890
-                    Caption text #2
-
-                    00:00:11.890 --> 00:00:16.320
-                    Caption text #3
-
-                    00:00:16.320 --> 00:00:21.580
-                    Caption text #4
-                    '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence2.webvtt').read_text(),
-                textwrap.dedent(
-                    '''
-                    WEBVTT
-                    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                    00:00:16.320 --> 00:00:21.580
-                    Caption text #4
-
-                    00:00:21.580 --> 00:00:23.880
-                    Caption text #5
-
-                    00:00:23.880 --> 00:00:27.280
-                    Caption text #6
-
-                    00:00:27.280 --> 00:00:30.280
-                    Caption text #7
-                    '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence3.webvtt').read_text(),
-                textwrap.dedent(
-                    '''
-                    WEBVTT
-                    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                    00:00:27.280 --> 00:00:30.280
-                    Caption text #7
-
-                    00:00:30.280 --> 00:00:36.510
-                    Caption text #8
-
-                    00:00:36.510 --> 00:00:38.870
-                    Caption text #9
-
-                    00:00:38.870 --> 00:00:45.000
-                    Caption text #10
-                    '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence4.webvtt').read_text(),
-                textwrap.dedent(
-                    '''
-                    WEBVTT
-                    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                    00:00:38.870 --> 00:00:45.000
-                    Caption text #10
-
-                    00:00:45.000 --> 00:00:47.000
-                    Caption text #11
-
-                    00:00:47.000 --> 00:00:50.970
-                    Caption text #12
-                    '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence5.webvtt').read_text(),
-                textwrap.dedent(
-                    '''
-                    WEBVTT
-                    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                    00:00:47.000 --> 00:00:50.970
-                    Caption text #12
-
-                    00:00:50.970 --> 00:00:54.440
-                    Caption text #13
-
-                    00:00:54.440 --> 00:00:58.600
-                    Caption text #14
-
-                    00:00:58.600 --> 00:01:01.350
-                    Caption text #15
-                    '''
-                ).lstrip())
-            self.assertEqual(
-                (pathlib.Path(temp_dir) / 'fileSequence6.webvtt').read_text(),
-                textwrap.dedent(
-                    '''
-                    WEBVTT
-                    X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
-
-                    00:00:58.600 --> 00:01:01.350
-                    Caption text #15
-
-                    00:01:01.350 --> 00:01:04.300
-                    Caption text #16
-                    '''
-                ).lstrip())
+            self.assertSetEqual(set(files), set(_EXPECTED_FILES))
+
+            for name, expected in _EXPECTED_FILES.items():
+                with self.subTest(name=name):
+                    self.assertEqual(
+                        (pathlib.Path(temp_dir) / name).read_bytes(),
+                        expected
+                        )
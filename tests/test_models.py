@@ -1,4 +1,6 @@
 import unittest
+import copy
+import pickle
 
 from webvtt.models import Timestamp, Caption, Style
 from webvtt.errors import MalformedCaptionError
@@ -36,6 +38,27 @@ class TestTimestamp(unittest.TestCase):
         self.assertEqual(timestamp.seconds, 11)
         self.assertEqual(timestamp.milliseconds, 670)
 
+    def test_from_string_non_ascii_digits(self):
+        timestamp = Timestamp.from_string('\u0660\u0661:\u0662\u0664:'
+                                          '\u0661\u0661.\u0666\u0667\u0660')
+        self.assertEqual(timestamp.to_tuple(), (1, 24, 11, 670))
+
+    def test_str_from_string_non_ascii_digits(self):
+        # same length as the HH:MM:SS.mmm form but not reusable as its string
+        value = '\u0660\u0661:\u0662\u0664:\u0661\u0661.\u0666\u0667\u0660'
+        self.assertEqual(len(value), 12)
+        self.assertEqual(str(Timestamp.from_string(value)), '01:24:11.670')
+
+    def test_from_string_overridden_pattern(self):
+        class CommaTimestamp(Timestamp):
+            PATTERN = r'(?:(\d{1,2}):)?(\d{1,2}):(\d{1,2}),(\d{3})'
+
+        timestamp = CommaTimestamp.from_string('01:24:11,670')
+        self.assertEqual(timestamp.to_tuple(), (1, 24, 11, 670))
+        self.assertEqual(str(timestamp), '01:24:11.670')
+        with self.assertRaises(MalformedCaptionError):
+            CommaTimestamp.from_string('01:24:11.670')
+
     def test_from_string_wrong_minutes(self):
         with self.assertRaises(MalformedCaptionError):
             Timestamp.from_string('01:76:11.670')
@@ -52,6 +75,14 @@ class TestTimestamp(unittest.TestCase):
         with self.assertRaises(MalformedCaptionError):
             Timestamp.from_string('01:24:11:670')
 
+    def test_from_string_trailing_input(self):
+        for value in ('00:00:01.000 ', '00:00:01.0000', '00:00:01.000x'):
+            with self.subTest(value=value):
+                with self.assertRaises(MalformedCaptionError):
+                    Timestamp.from_string(value)
+                with self.assertRaises(MalformedCaptionError):
+                    Caption(start=value)
+
     def test_to_tuple(self):
         self.assertEqual(
             Timestamp(
@@ -120,6 +151,47 @@ class TestTimestamp(unittest.TestCase):
             Timestamp.from_string('01:12:23.600')
             )
 
+    def test_hash(self):
+        self.assertEqual(
+            hash(Timestamp(
+                hours=1, minutes=12, seconds=23, milliseconds=500
+                )),
+            hash(Timestamp.from_string('01:12:23.500'))
+            )
+        self.assertEqual(
+            len({Timestamp.from_string('01:12:23.500'),
+                 Timestamp.from_string('1:12:23.500'),
+                 Timestamp.from_string('01:12:23.600'),
+                 }),
+            2
+            )
+
+    def test_update_fields(self):
+        timestamp = Timestamp.from_string('01:12:23.500')
+        self.assertEqual(str(timestamp), '01:12:23.500')
+
+        timestamp.hours = 2
+        timestamp.minutes = 30
+        timestamp.seconds = 5
+        timestamp.milliseconds = 20
+        self.assertEqual(timestamp.to_tuple(), (2, 30, 5, 20))
+        self.assertEqual(str(timestamp), '02:30:05.020')
+        self.assertEqual(timestamp, Timestamp.from_string('02:30:05.020'))
+        self.assertGreater(timestamp, Timestamp.from_string('02:30:05.010'))
+        self.assertEqual(timestamp.in_seconds(), 9005)
+
+    def test_equality_of_total_time(self):
+        self.assertEqual(Timestamp(0, 0, 60, 0), Timestamp(0, 1, 0, 0))
+
+    def test_copy_and_pickle(self):
+        timestamp = Timestamp.from_string('01:12:23.500')
+        for other in (copy.copy(timestamp),
+                      copy.deepcopy(timestamp),
+                      pickle.loads(pickle.dumps(timestamp))
+                      ):
+            self.assertEqual(other.to_tuple(), (1, 12, 23, 500))
+            self.assertEqual(other, timestamp)
+
     def test_repr(self):
         timestamp = Timestamp(
             hours=1,
@@ -133,21 +205,78 @@ class TestTimestamp(unittest.TestCase):
             '<Timestamp hours=1 minutes=12 seconds=45 milliseconds=320>'
             )
 
+    def test_str(self):
+        timestamp = Timestamp(
+            hours=1,
+            minutes=12,
+            seconds=45,
+            milliseconds=320
+            )
+        self.assertEqual(str(timestamp), '01:12:45.320')
+        self.assertEqual(str(timestamp), '01:12:45.320')
+        self.assertEqual(
+            str(Timestamp(hours=1, minutes=12, seconds=3, milliseconds=320)),
+            '01:12:03.320'
+            )
+        self.assertEqual(
+            str(Timestamp.from_string('01:24:11.670')),
+            '01:24:11.670'
+            )
+        self.assertEqual(
+            str(Timestamp.from_string('1:2:7.670')),
+            '01:02:07.670'
+            )
+        self.assertEqual(
+            str(Timestamp.from_string('24:11.670')),
+            '00:24:11.670'
+            )
+
 
 class TestCaption(unittest.TestCase):
 
-    def test_instantiation(self):
-        caption = Caption(
+    @classmethod
+    def setUpClass(cls):
+        # shared by the tests that only read from the caption
+        cls.caption = Caption(
             start='00:00:07.000',
             end='00:00:11.890',
             text='Hello test!',
             identifier='A test caption'
             )
+
+    def test_instantiation(self):
+        caption = self.caption
         self.assertEqual(caption.start, '00:00:07.000')
         self.assertEqual(caption.end, '00:00:11.890')
         self.assertEqual(caption.text, 'Hello test!')
         self.assertEqual(caption.identifier, 'A test caption')
 
+    def test_from_records(self):
+        captions = Caption.from_records([
+            ('00:00:00.500', '00:00:07.000', ['Caption #1'], None),
+            ('00:00:07.000', '00:00:11.890', ['Line 1', 'Line 2'], 'second'),
+            ])
+
+        self.assertEqual(len(captions), 2)
+        self.assertEqual(
+            captions[0],
+            Caption('00:00:00.500', '00:00:07.000', 'Caption #1')
+            )
+        self.assertEqual(
+            captions[1],
+            Caption(
+                '00:00:07.000',
+                '00:00:11.890',
+                ['Line 1', 'Line 2'],
+                'second'
+                )
+            )
+        self.assertListEqual(captions[1].comments, [])
+
+    def test_from_records_malformed_timestamp(self):
+        with self.assertRaises(MalformedCaptionError):
+            Caption.from_records([('1234', '00:00:07.000', [], None)])
+
     def test_timestamp_wrong_type(self):
         with self.assertRaises(MalformedCaptionError):
             Caption(
@@ -208,6 +337,19 @@ class TestCaption(unittest.TestCase):
             'This is the <c.colorE5E5E5>second</c> line'
             )
 
+    def test_cuetags_overridden(self):
+        class BoldOnlyCaption(Caption):
+            CUE_TEXT_TAGS = '</?b>'
+
+        caption = BoldOnlyCaption(text='<b>Hello</b> <i>test</i>!')
+        self.assertEqual(caption.text, 'Hello <i>test</i>!')
+
+        class BracketCaption(Caption):
+            CUE_TEXT_TAGS = r'\[.*?\]'
+
+        caption = BracketCaption(text='Hello [music] test!')
+        self.assertEqual(caption.text, 'Hello  test!')
+
     def test_in_seconds(self):
         caption = Caption(
             start='00:00:07.000',
@@ -287,22 +429,10 @@ class TestCaption(unittest.TestCase):
 
         self.assertFalse(caption1 == caption2)
 
-        self.assertFalse(
-            Caption(
-                start='00:00:07.000',
-                end='00:00:11.890',
-                text='Hello test!',
-                identifier='A test caption'
-                ) == 1234
-            )
+        self.assertFalse(self.caption == 1234)
 
     def test_repr(self):
-        caption = Caption(
-            start='00:00:07.000',
-            end='00:00:11.890',
-            text='Hello test!',
-            identifier='A test caption'
-            )
+        caption = self.caption
 
         self.assertEqual(
             repr(caption),
@@ -311,12 +441,7 @@ class TestCaption(unittest.TestCase):
             )
 
     def test_str(self):
-        caption = Caption(
-            start='00:00:07.000',
-            end='00:00:11.890',
-            text='Hello test!',
-            identifier='A test caption'
-            )
+        caption = self.caption
 
         self.assertEqual(
             str(caption),
@@ -338,6 +463,18 @@ class TestCaption(unittest.TestCase):
             ['One comment', 'Another comment']
             )
 
+    def test_has_comments(self):
+        caption = Caption(text='Hello test!')
+        self.assertFalse(caption.has_comments)
+        self.assertEqual(caption.comments, [])
+        self.assertFalse(caption.has_comments)
+
+        caption.comments.append('One comment')
+        self.assertTrue(caption.has_comments)
+
+        caption.comments = []
+        self.assertFalse(caption.has_comments)
+
     def test_timestamp_update(self):
         c = Caption('00:00:00.500', '00:00:07.000')
         c.start = '00:00:01.750'
@@ -396,6 +533,30 @@ class TestCaption(unittest.TestCase):
             'Caption line #1 updated'
             )
 
+    def test_manipulate_lines_updates_text(self):
+        c = Caption(text=['Caption line #1', 'Caption line #2'])
+        self.assertEqual(c.text, 'Caption line #1\nCaption line #2')
+
+        c.lines[0] = 'Caption line #1 updated'
+        self.assertEqual(c.text, 'Caption line #1 updated\nCaption line #2')
+
+        c.lines.append('Caption line #3')
+        self.assertEqual(
+            c.raw_text,
+            'Caption line #1 updated\nCaption line #2\nCaption line #3'
+            )
+
+        del c.lines[1:]
+        self.assertEqual(c.text, 'Caption line #1 updated')
+
+        lines = ['Caption line #4']
+        c.lines = lines
+        self.assertEqual(c.text, 'Caption line #4')
+
+        # the setter keeps a copy of the lines
+        lines.append('Caption line #5')
+        self.assertEqual(c.lines, ['Caption line #4'])
+
     def test_malformed_start_timestamp(self):
         self.assertRaises(
             MalformedCaptionError,
@@ -447,6 +608,15 @@ class TestCaption(unittest.TestCase):
         self.assertEqual(caption.raw_text, 'This is a test')
         self.assertIsNone(caption.voice)
 
+    def test_voice_span_overridden(self):
+        class NoClassesCaption(Caption):
+            VOICE_SPAN_PATTERN = r'<v\s+([^>]+)>'
+
+        caption = NoClassesCaption(text='<v.loud Homer>I like tests</v>')
+        self.assertIsNone(caption.voice)
+        caption.text = '<v Homer>I like tests</v>'
+        self.assertEqual(caption.voice, 'Homer')
+
 
 class TestStyle(unittest.TestCase):
 
@@ -482,3 +652,18 @@ class TestStyle(unittest.TestCase):
             style.text,
             '::cue(b) {\n  color: peachpuff;\n}'
             )
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        caption = Caption(text='Caption #1')
+        instances = (
+            Timestamp.from_string('00:00:00.500'),
+            caption,
+            caption.lines,
+            Style(text='::cue(b) {\ncolor: peachpuff;\n}'),
+            )
+        for instance in instances:
+            with self.subTest(type(instance).__name__):
+                self.assertFalse(hasattr(instance, '__dict__'))
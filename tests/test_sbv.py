@@ -99,6 +99,12 @@ class TestSBVCueBlock(unittest.TestCase):
             '0:1:03.800'
             )
 
+    def test_no_instance_dict(self):
+        cue_block = sbv.SBVCueBlock.from_lines(
+            ['00:00:00.500,00:00:07.000', 'Caption #1']
+            )
+        self.assertFalse(hasattr(cue_block, '__dict__'))
+
 
 class TestSBVModule(unittest.TestCase):
 
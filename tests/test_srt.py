@@ -7,67 +7,52 @@ from webvtt.errors import MalformedFileError
 from webvtt.models import Caption
 
 
-class TestSRTCueBlock(unittest.TestCase):
-
-    def test_is_valid(self):
-        self.assertTrue(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            1
-            00:00:00,500 --> 00:00:07,000
-            Caption #1
-            ''').strip().split('\n'))
-            )
-
-        self.assertTrue(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            1
-            00:00:00,500 --> 00:00:07,000
-            Caption #1 line 1
-            Caption #1 line 2
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            00:00:00,500 --> 00:00:07,000
-            Caption #1
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            1
-            00:00:00.500 --> 00:00:07.000
-            Caption #1
-            ''').strip().split('\n'))
-            )
+VALID_CUE_BLOCKS = (
+    ('1',
+     '00:00:00,500 --> 00:00:07,000',
+     'Caption #1'
+     ),
+    ('1',
+     '00:00:00,500 --> 00:00:07,000',
+     'Caption #1 line 1',
+     'Caption #1 line 2'
+     ),
+    )
+
+INVALID_CUE_BLOCKS = (
+    ('00:00:00,500 --> 00:00:07,000',
+     'Caption #1'
+     ),
+    ('1',
+     '00:00:00.500 --> 00:00:07.000',
+     'Caption #1'
+     ),
+    ('1',
+     '00:00:00,500 --> 00:00:07,000'
+     ),
+    ('1',
+     'Caption #1'
+     ),
+    ('Caption #1',
+     ),
+    ('00:00:00,500 --> 00:00:07,000',
+     ),
+    )
 
-        self.assertFalse(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            1
-            00:00:00,500 --> 00:00:07,000
-            ''').strip().split('\n'))
-            )
 
-        self.assertFalse(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            1
-            Caption #1
-            ''').strip().split('\n'))
-            )
+class TestSRTCueBlock(unittest.TestCase):
 
-        self.assertFalse(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            Caption #1
-            ''').strip().split('\n'))
-            )
+    def test_is_valid(self):
+        for lines in VALID_CUE_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertTrue(srt.SRTCueBlock.is_valid(lines))
 
-        self.assertFalse(srt.SRTCueBlock.is_valid(textwrap.dedent('''
-            00:00:00,500 --> 00:00:07,000
-            ''').strip().split('\n'))
-            )
+        for lines in INVALID_CUE_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertFalse(srt.SRTCueBlock.is_valid(lines))
 
     def test_from_lines(self):
-        cue_block = srt.SRTCueBlock.from_lines(textwrap.dedent('''
-            1
-            00:00:00,500 --> 00:00:07,000
-            Caption #1 line 1
-            Caption #1 line 2
-            ''').strip().split('\n')
-            )
+        cue_block = srt.SRTCueBlock.from_lines(list(VALID_CUE_BLOCKS[1]))
         self.assertEqual(cue_block.index, '1')
         self.assertEqual(
             cue_block.start,
@@ -82,6 +67,10 @@ class TestSRTCueBlock(unittest.TestCase):
             ['Caption #1 line 1', 'Caption #1 line 2']
             )
 
+    def test_no_instance_dict(self):
+        cue_block = srt.SRTCueBlock.from_lines(VALID_CUE_BLOCKS[0])
+        self.assertFalse(hasattr(cue_block, '__dict__'))
+
 
 class TestSRTModule(unittest.TestCase):
 
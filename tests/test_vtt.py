@@ -7,62 +7,247 @@ from webvtt.errors import MalformedFileError
 from webvtt.models import Caption, Style
 
 
-class TestWebVTTCueBlock(unittest.TestCase):
-
-    def test_is_valid(self):
-        self.assertTrue(
-            vtt.WebVTTCueBlock.is_valid(textwrap.dedent('''
-            00:00:00.500 --> 00:00:07.000
-            Caption #1
-            ''').strip().split('\n'))
-            )
-
-        self.assertTrue(
-            vtt.WebVTTCueBlock.is_valid(textwrap.dedent('''
-            00:00:00.500 --> 00:00:07.000
-            Caption #1 line 1
-            Caption #1 line 2
-            ''').strip().split('\n'))
-            )
+VALID_CUE_BLOCKS = (
+    ('00:00:00.500 --> 00:00:07.000',
+     'Caption #1'
+     ),
+    ('00:00:00.500 --> 00:00:07.000',
+     'Caption #1 line 1',
+     'Caption #1 line 2'
+     ),
+    ('identifier',
+     '00:00:00.500 --> 00:00:07.000',
+     'Caption #1'
+     ),
+    ('identifier',
+     '00:00:00.500 --> 00:00:07.000',
+     'Caption #1 line 1',
+     'Caption #1 line 2'
+     ),
+    )
+
+INVALID_CUE_BLOCKS = (
+    ('00:00:00.500 00:00:07.000',
+     'Caption #1 line 1'
+     ),
+    ('00:00:00.500 --> 00:00:07.000',
+     ),
+    )
+
+VALID_COMMENT_BLOCKS = (
+    ('NOTE This is a one line comment',
+     ),
+    ('NOTE',
+     'This is a another one line comment'
+     ),
+    ('NOTE',
+     'This is a multi-line comment',
+     'taking two lines'
+     ),
+    )
+
+INVALID_COMMENT_BLOCKS = (
+    ('This is not a comment',
+     ),
+    ('# This is not a comment',
+     ),
+    ('// This is not a comment',
+     ),
+    )
+
+VALID_STYLE_BLOCKS = (
+    ('STYLE',
+     '::cue {',
+     '  background-image: linear-gradient(to bottom, dimgray, lightgray);',
+     '  color: papayawhip;',
+     '}'
+     ),
+    ('STYLE',
+     '::cue {',
+     '  background-image: linear-gradient(to bottom, dimgray, lightgray);',
+     '  color: papayawhip;',
+     '}',
+     '::cue(b) {',
+     '  color: peachpuff;',
+     '}'
+     ),
+    )
+
+INVALID_STYLE_BLOCKS = (
+    ('STYLE',
+     '::cue {',
+     '  background-image: linear-gradient(to bottom, dimgray, lightgray);',
+     '  color: papayawhip;',
+     '}',
+     '',
+     '::cue(b) {',
+     '  color: peachpuff;',
+     '}'
+     ),
+    ('STYLE',
+     '::cue--> {',
+     '  background-image: linear-gradient(to bottom, dimgray, lightgray);',
+     '  color: papayawhip;',
+     '}'
+     ),
+    ('::cue {',
+     '  background-image: linear-gradient(to bottom, dimgray, lightgray);',
+     '  color: papayawhip;',
+     '}'
+     ),
+    )
+
+
+PARSE_CASES = (
+    ('captions',
+     tuple(textwrap.dedent('''
+        WEBVTT
+
+        00:00:00.500 --> 00:00:07.000
+        Caption text #1
+
+        00:00:07.000 --> 00:00:11.890
+        Caption text #2 line 1
+        Caption text #2 line 2
+        ''').strip().split('\n')),
+     {'captions': [
+         ('00:00:00.500 00:00:07.000 Caption text #1', []),
+         (r'00:00:07.000 00:00:11.890 Caption text #2 line 1\n'
+          'Caption text #2 line 2',
+          []
+          ),
+         ],
+      'styles': [],
+      'header_comments': [],
+      'footer_comments': []
+      }
+     ),
+    ('styles',
+     tuple(textwrap.dedent('''
+        WEBVTT
+
+        STYLE
+        ::cue {
+          color: white;
+        }
+
+        STYLE
+        ::cue(.important) {
+          color: red;
+          font-weight: bold;
+        }
+
+        00:00:00.500 --> 00:00:07.000
+        Caption text #1
+        ''').strip().split('\n')),
+     {'captions': [
+         ('00:00:00.500 00:00:07.000 Caption text #1', []),
+         ],
+      'styles': [
+         ('::cue {\n'
+          '  color: white;\n'
+          '}',
+          []
+          ),
+         ('::cue(.important) {\n'
+          '  color: red;\n'
+          '  font-weight: bold;\n'
+          '}',
+          []
+          ),
+         ],
+      'header_comments': [],
+      'footer_comments': []
+      }
+     ),
+    ('content',
+     tuple(textwrap.dedent('''
+        WEBVTT
+
+        NOTE This is a testing sample
+
+        NOTE We can see two header comments, a style
+        comment and finally a footer comments
+
+        STYLE
+        ::cue {
+          background-image: linear-gradient(to bottom, dimgray);
+          color: papayawhip;
+        }
+
+        NOTE the following style needs review
+
+        STYLE
+        ::cue {
+          color: white;
+        }
+
+        NOTE Comment for the first caption
+
+        00:00:00.500 --> 00:00:07.000
+        Caption text #1
+
+        NOTE
+        Comment for the second caption
+        that is very long
+
+        00:00:07.000 --> 00:00:11.890
+        Caption text #2 line 1
+        Caption text #2 line 2
+
+        NOTE Copyright 2024
+
+        NOTE end of file
+        ''').strip().split('\n')),
+     {'captions': [
+         ('00:00:00.500 00:00:07.000 Caption text #1',
+          ['Comment for the first caption']
+          ),
+         (r'00:00:07.000 00:00:11.890 Caption text #2 line 1\n'
+          'Caption text #2 line 2',
+          ['Comment for the second caption\nthat is very long']
+          ),
+         ],
+      'styles': [
+         ('::cue {\n'
+          '  background-image: linear-gradient(to bottom, dimgray);\n'
+          '  color: papayawhip;\n'
+          '}',
+          []
+          ),
+         ('::cue {\n'
+          '  color: white;\n'
+          '}',
+          ['the following style needs review']
+          ),
+         ],
+      'header_comments': [
+         'This is a testing sample',
+         'We can see two header comments, a style\n'
+         'comment and finally a footer comments'
+         ],
+      'footer_comments': [
+         'Copyright 2024',
+         'end of file'
+         ]
+      }
+     ),
+    )
 
-        self.assertTrue(
-            vtt.WebVTTCueBlock.is_valid(textwrap.dedent('''
-            identifier
-            00:00:00.500 --> 00:00:07.000
-            Caption #1
-            ''').strip().split('\n'))
-            )
 
-        self.assertTrue(
-            vtt.WebVTTCueBlock.is_valid(textwrap.dedent('''
-            identifier
-            00:00:00.500 --> 00:00:07.000
-            Caption #1 line 1
-            Caption #1 line 2
-            ''').strip().split('\n'))
-            )
+class TestWebVTTCueBlock(unittest.TestCase):
 
-        self.assertFalse(
-            vtt.WebVTTCueBlock.is_valid(textwrap.dedent('''
-            00:00:00.500 00:00:07.000
-            Caption #1 line 1
-            ''').strip().split('\n'))
-            )
+    def test_is_valid(self):
+        for lines in VALID_CUE_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertTrue(vtt.WebVTTCueBlock.is_valid(lines))
 
-        self.assertFalse(
-            vtt.WebVTTCueBlock.is_valid(textwrap.dedent('''
-            00:00:00.500 --> 00:00:07.000
-            ''').strip().split('\n'))
-            )
+        for lines in INVALID_CUE_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertFalse(vtt.WebVTTCueBlock.is_valid(lines))
 
     def test_from_lines(self):
-        cue_block = vtt.WebVTTCueBlock.from_lines(textwrap.dedent('''
-            identifier
-            00:00:00.500 --> 00:00:07.000
-            Caption #1 line 1
-            Caption #1 line 2
-            ''').strip().split('\n')
-            )
+        cue_block = vtt.WebVTTCueBlock.from_lines(VALID_CUE_BLOCKS[3])
         self.assertEqual(cue_block.identifier, 'identifier')
         self.assertEqual(cue_block.start, '00:00:00.500')
         self.assertEqual(cue_block.end, '00:00:07.000')
@@ -75,135 +260,41 @@ class TestWebVTTCueBlock(unittest.TestCase):
 class TestWebVTTCommentBlock(unittest.TestCase):
 
     def test_is_valid(self):
-        self.assertTrue(
-            vtt.WebVTTCommentBlock.is_valid(textwrap.dedent('''
-            NOTE This is a one line comment
-            ''').strip().split('\n'))
-            )
+        for lines in VALID_COMMENT_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertTrue(vtt.WebVTTCommentBlock.is_valid(lines))
 
-        self.assertTrue(
-            vtt.WebVTTCommentBlock.is_valid(textwrap.dedent('''
-            NOTE
-            This is a another one line comment
-            ''').strip().split('\n'))
-            )
-
-        self.assertTrue(
-            vtt.WebVTTCommentBlock.is_valid(textwrap.dedent('''
-            NOTE
-            This is a multi-line comment
-            taking two lines
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(
-            vtt.WebVTTCommentBlock.is_valid(textwrap.dedent('''
-            This is not a comment
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(
-            vtt.WebVTTCommentBlock.is_valid(textwrap.dedent('''
-            # This is not a comment
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(
-            vtt.WebVTTCommentBlock.is_valid(textwrap.dedent('''
-            // This is not a comment
-            ''').strip().split('\n'))
-            )
+        for lines in INVALID_COMMENT_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertFalse(vtt.WebVTTCommentBlock.is_valid(lines))
 
     def test_from_lines(self):
-        comment = vtt.WebVTTCommentBlock.from_lines(textwrap.dedent('''
-            NOTE This is a one line comment
-            ''').strip().split('\n')
-            )
+        comment = vtt.WebVTTCommentBlock.from_lines(VALID_COMMENT_BLOCKS[0])
         self.assertEqual(comment.text, 'This is a one line comment')
 
-        comment = vtt.WebVTTCommentBlock.from_lines(textwrap.dedent('''
-            NOTE
-            This is a multi-line comment
-            taking two lines
-            ''').strip().split('\n')
-            )
+        comment = vtt.WebVTTCommentBlock.from_lines(VALID_COMMENT_BLOCKS[2])
         self.assertEqual(
             comment.text,
             'This is a multi-line comment\ntaking two lines'
             )
 
+        comment = vtt.WebVTTCommentBlock.from_lines(['NOTEThis is not valid'])
+        self.assertEqual(comment.text, '')
+
 
 class TestWebVTTStyleBlock(unittest.TestCase):
 
     def test_is_valid(self):
-        self.assertTrue(
-            vtt.WebVTTStyleBlock.is_valid(textwrap.dedent('''
-            STYLE
-            ::cue {
-              background-image: linear-gradient(to bottom, dimgray, lightgray);
-              color: papayawhip;
-            }
-            ''').strip().split('\n'))
-            )
-
-        self.assertTrue(
-            vtt.WebVTTStyleBlock.is_valid(textwrap.dedent('''
-            STYLE
-            ::cue {
-              background-image: linear-gradient(to bottom, dimgray, lightgray);
-              color: papayawhip;
-            }
-            ::cue(b) {
-              color: peachpuff;
-            }
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(
-            vtt.WebVTTStyleBlock.is_valid(textwrap.dedent('''
-            STYLE
-            ::cue {
-              background-image: linear-gradient(to bottom, dimgray, lightgray);
-              color: papayawhip;
-            }
-
-            ::cue(b) {
-              color: peachpuff;
-            }
-            ''').strip().split('\n'))
-            )
+        for lines in VALID_STYLE_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertTrue(vtt.WebVTTStyleBlock.is_valid(lines))
 
-        self.assertFalse(
-            vtt.WebVTTStyleBlock.is_valid(textwrap.dedent('''
-            STYLE
-            ::cue--> {
-              background-image: linear-gradient(to bottom, dimgray, lightgray);
-              color: papayawhip;
-            }
-            ''').strip().split('\n'))
-            )
-
-        self.assertFalse(
-            vtt.WebVTTStyleBlock.is_valid(textwrap.dedent('''
-            ::cue {
-              background-image: linear-gradient(to bottom, dimgray, lightgray);
-              color: papayawhip;
-            }
-            ''').strip().split('\n'))
-            )
+        for lines in INVALID_STYLE_BLOCKS:
+            with self.subTest(lines=lines):
+                self.assertFalse(vtt.WebVTTStyleBlock.is_valid(lines))
 
     def test_from_lines(self):
-        style = vtt.WebVTTStyleBlock.from_lines(textwrap.dedent('''
-            STYLE
-            ::cue {
-              background-image: linear-gradient(to bottom, dimgray, lightgray);
-              color: papayawhip;
-            }
-            ::cue(b) {
-              color: peachpuff;
-            }
-            ''').strip().split('\n')
-            )
+        style = vtt.WebVTTStyleBlock.from_lines(VALID_STYLE_BLOCKS[1])
         self.assertEqual(
             style.text,
             textwrap.dedent('''
@@ -217,9 +308,22 @@ class TestWebVTTStyleBlock(unittest.TestCase):
             ''').strip()
             )
 
+        style = vtt.WebVTTStyleBlock.from_lines(['STYLE::cue { color: red; }'])
+        self.assertEqual(style.text, '')
+
 
 class TestVTTModule(unittest.TestCase):
 
+    def test_no_instance_dict(self):
+        blocks = (
+            vtt.WebVTTCueBlock.from_lines(VALID_CUE_BLOCKS[0]),
+            vtt.WebVTTCommentBlock.from_lines(VALID_COMMENT_BLOCKS[0]),
+            vtt.WebVTTStyleBlock.from_lines(VALID_STYLE_BLOCKS[0]),
+            )
+        for block in blocks:
+            with self.subTest(type(block).__name__):
+                self.assertFalse(hasattr(block, '__dict__'))
+
     def test_parse_invalid_format(self):
         self.assertRaises(
             MalformedFileError,
@@ -233,181 +337,64 @@ class TestVTTModule(unittest.TestCase):
                 ''').strip().split('\n')
             )
 
-    def test_parse_captions(self):
+    def test_parse(self):
+        for name, lines, expected in PARSE_CASES:
+            with self.subTest(name):
+                output = vtt.parse(lines)
+                for item in output.captions:
+                    self.assertIsInstance(item, Caption)
+                for item in output.styles:
+                    self.assertIsInstance(item, Style)
+                self.assertListEqual(
+                    [(str(caption), caption.comments)
+                     for caption in output.captions],
+                    expected['captions']
+                    )
+                self.assertListEqual(
+                    [(style.text, style.comments) for style in output.styles],
+                    expected['styles']
+                    )
+                self.assertListEqual(
+                    output.header_comments,
+                    expected['header_comments']
+                    )
+                self.assertListEqual(
+                    output.footer_comments,
+                    expected['footer_comments']
+                    )
+
+    def test_parse_iterator(self):
         output = vtt.parse(
-            textwrap.dedent('''
+            iter(textwrap.dedent('''
             WEBVTT
 
             00:00:00.500 --> 00:00:07.000
             Caption text #1
-
-            00:00:07.000 --> 00:00:11.890
-            Caption text #2 line 1
-            Caption text #2 line 2
-            ''').strip().split('\n')
+            ''').strip().split('\n'))
             )
-        captions = output.captions
-        styles = output.styles
-        self.assertEqual(len(captions), 2)
-        self.assertEqual(len(styles), 0)
-        self.assertIsInstance(captions[0], Caption)
-        self.assertIsInstance(captions[1], Caption)
+        self.assertEqual(len(output.captions), 1)
         self.assertEqual(
-            str(captions[0]),
+            str(output.captions[0]),
             '00:00:00.500 00:00:07.000 Caption text #1'
             )
-        self.assertEqual(
-            str(captions[1]),
-            r'00:00:07.000 00:00:11.890 Caption text #2 line 1\n'
-            'Caption text #2 line 2'
-            )
-
-    def test_parse_styles(self):
-        output = vtt.parse(
-            textwrap.dedent('''
-            WEBVTT
-
-            STYLE
-            ::cue {
-              color: white;
-            }
-
-            STYLE
-            ::cue(.important) {
-              color: red;
-              font-weight: bold;
-            }
 
-            00:00:00.500 --> 00:00:07.000
-            Caption text #1
-            ''').strip().split('\n')
-            )
-        captions = output.captions
-        styles = output.styles
-        self.assertEqual(len(captions), 1)
-        self.assertEqual(len(styles), 2)
-        self.assertIsInstance(styles[0], Style)
-        self.assertIsInstance(styles[1], Style)
-        self.assertEqual(
-            str(styles[0].text),
-            textwrap.dedent('''
-                ::cue {
-                  color: white;
-                }
-                ''').strip()
-            )
-        self.assertEqual(
-            str(styles[1].text),
-            textwrap.dedent('''
-                ::cue(.important) {
-                  color: red;
-                  font-weight: bold;
-                }
-                ''').strip(),
-            )
+    def test_parse_empty(self):
+        self.assertRaises(MalformedFileError, vtt.parse, iter([]))
 
-    def test_parse_content(self):
+    def test_parse_cue_with_style_identifier(self):
         output = vtt.parse(
             textwrap.dedent('''
             WEBVTT
 
-            NOTE This is a testing sample
-
-            NOTE We can see two header comments, a style
-            comment and finally a footer comments
-
-            STYLE
-            ::cue {
-              background-image: linear-gradient(to bottom, dimgray);
-              color: papayawhip;
-            }
-
-            NOTE the following style needs review
-
             STYLE
-            ::cue {
-              color: white;
-            }
-
-            NOTE Comment for the first caption
-
             00:00:00.500 --> 00:00:07.000
             Caption text #1
-
-            NOTE
-            Comment for the second caption
-            that is very long
-
-            00:00:07.000 --> 00:00:11.890
-            Caption text #2 line 1
-            Caption text #2 line 2
-
-            NOTE Copyright 2024
-
-            NOTE end of file
             ''').strip().split('\n')
             )
-        captions = output.captions
-        styles = output.styles
-        self.assertEqual(len(captions), 2)
-        self.assertEqual(len(styles), 2)
-        self.assertIsInstance(captions[0], Caption)
-        self.assertIsInstance(captions[1], Caption)
-        self.assertIsInstance(styles[0], Style)
-        self.assertIsInstance(styles[1], Style)
-        self.assertEqual(
-            str(captions[0]),
-            '00:00:00.500 00:00:07.000 Caption text #1'
-            )
-        self.assertEqual(
-            str(captions[1]),
-            r'00:00:07.000 00:00:11.890 Caption text #2 line 1\n'
-            'Caption text #2 line 2'
-            )
-        self.assertEqual(
-            str(styles[0].text),
-            textwrap.dedent('''
-                ::cue {
-                  background-image: linear-gradient(to bottom, dimgray);
-                  color: papayawhip;
-                }
-                ''').strip()
-            )
-        self.assertEqual(
-            str(styles[1].text),
-            textwrap.dedent('''
-                ::cue {
-                  color: white;
-                }
-                ''').strip()
-            )
-        self.assertEqual(
-            styles[0].comments,
-            []
-            )
-        self.assertEqual(
-            styles[1].comments,
-            ['the following style needs review']
-            )
-        self.assertEqual(
-            captions[0].comments,
-            ['Comment for the first caption']
-            )
-        self.assertEqual(
-            captions[1].comments,
-            ['Comment for the second caption\nthat is very long']
-            )
-        self.assertListEqual(output.header_comments,
-                             ['This is a testing sample',
-                              'We can see two header comments, a style\n'
-                              'comment and finally a footer comments'
-                              ]
-                             )
-        self.assertListEqual(output.footer_comments,
-                             ['Copyright 2024',
-                              'end of file'
-                              ]
-                             )
+        self.assertEqual(len(output.styles), 0)
+        self.assertEqual(len(output.captions), 1)
+        self.assertEqual(output.captions[0].identifier, 'STYLE')
+        self.assertEqual(output.captions[0].text, 'Caption text #1')
 
     def test_write(self):
         out = io.StringIO()
@@ -443,47 +430,29 @@ class TestVTTModule(unittest.TestCase):
             footer_comments
             )
 
-        out.seek(0)
-
+        # write is a thin wrapper over to_str, the output itself is
+        # checked in test_to_str
         self.assertEqual(
-            out.read(),
-            textwrap.dedent('''
-                WEBVTT
-
-                NOTE header comment
-
-                NOTE begin of the file
-
-                STYLE
-                ::cue(b) {
-                  color: peachpuff;
-                }
-
-                NOTE
-                Comment for the second style
-                with two lines
-
-                STYLE
-                ::cue {
-                  color: papayawhip;
-                }
-
-                NOTE Comment for the first caption
-
-                00:00:00.500 --> 00:00:07.000
-                Caption #1
-
-                NOTE Comment for the second caption
-
-                00:00:07.000 --> 00:00:11.890
-                Caption #2 line 1
-                Caption #2 line 2
+            out.getvalue(),
+            vtt.to_str(
+                captions,
+                styles,
+                header_comments,
+                footer_comments
+                )
+            )
 
-                NOTE footer comment
+    def test_to_str_caption_without_comments(self):
+        caption = Caption(start='00:00:00.500',
+                          end='00:00:07.000',
+                          text='Caption #1'
+                          )
 
-                NOTE end of file
-            ''').strip()
+        self.assertEqual(
+            vtt.to_str([caption], [], [], []),
+            'WEBVTT\n\n00:00:00.500 --> 00:00:07.000\nCaption #1\n'
             )
+        self.assertFalse(caption.has_comments)
 
     def test_to_str(self):
         captions = [
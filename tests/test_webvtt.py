@@ -13,9 +13,237 @@ from webvtt.errors import MalformedFileError
 
 PATH_TO_SAMPLES = pathlib.Path(__file__).resolve().parent / 'samples'
 
+# contents of the samples read once, most tests parse them from memory and
+# only the ones about file handling open the files
+_SAMPLE_CACHE = {path.name: path.read_text(encoding='utf-8')
+                 for path in PATH_TO_SAMPLES.iterdir()
+                 if path.is_file()
+                 }
+
+
+def _sample_text(name):
+    return _SAMPLE_CACHE[name]
+
+
+def _sample_buffer(name):
+    return io.StringIO(_SAMPLE_CACHE[name])
+
+
+_PARSED_VTT = {}
+
+
+def _parsed_vtt(name):
+    # shared between tests, only for the ones that do not change it, the
+    # content is kept to check in tearDown that they did not
+    if name not in _PARSED_VTT:
+        vtt = webvtt.from_buffer(_sample_buffer(name))
+        _PARSED_VTT[name] = (vtt, vtt.content)
+    return _PARSED_VTT[name][0]
+
+
+def _changed_parsed_vtt():
+    return [name
+            for name, (vtt, content) in _PARSED_VTT.items()
+            if vtt.content != content
+            ]
+
+
+_UTF8_BOM = CODEC_BOMS['utf-8'].decode()
+
+_WRITE_CAPTIONS_VTT = textwrap.dedent(
+    '''
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption text #1
+
+    00:00:07.000 --> 00:00:11.890
+    New caption text line1
+    New caption text line2
+    '''
+    ).lstrip()
+
+_WRITE_CAPTIONS_SRT = textwrap.dedent(
+    '''
+    1
+    00:00:00,500 --> 00:00:07,000
+    Caption text #1
+
+    2
+    00:00:07,000 --> 00:00:11,890
+    New caption text line1
+    New caption text line2
+    '''
+    ).strip()
+
+_CUE_TAGS_SRT = textwrap.dedent(
+    '''
+    1
+    00:00:16,500 --> 00:00:18,500
+    When the moon hits your eye
+
+    2
+    00:00:18,500 --> 00:00:20,500
+    Like a big-a pizza pie
+
+    3
+    00:00:20,500 --> 00:00:21,500
+    That's amore
+    '''
+    ).strip()
+
+_ONE_CAPTION_VTT = textwrap.dedent(
+    '''
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption text #1
+    '''
+    ).lstrip()
+
+_TWO_CAPTIONS_VTT = textwrap.dedent(
+    '''
+    WEBVTT
+
+    00:00:00.378 --> 00:00:11.378
+    Caption text #1
+
+    00:00:11.378 --> 00:00:12.305
+    Caption text #2 (line 1)
+    Caption text #2 (line 2)
+    '''
+    ).lstrip()
+
+_FOUR_CAPTIONS_VTT = textwrap.dedent(
+    '''
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption text #1
+
+    00:00:07.000 --> 00:00:11.890
+    Caption text #2
+
+    00:00:11.890 --> 00:00:16.320
+    Caption text #3
+
+    00:00:16.320 --> 00:00:21.580
+    Caption text #4
+    '''
+    ).lstrip()
+
+_SAMPLE_STR = textwrap.dedent(
+    '''
+    00:00:00.500 00:00:07.000 Caption text #1
+    00:00:07.000 00:00:11.890 Caption text #2
+    00:00:11.890 00:00:16.320 Caption text #3
+    00:00:16.320 00:00:21.580 Caption text #4
+    00:00:21.580 00:00:23.880 Caption text #5
+    00:00:23.880 00:00:27.280 Caption text #6
+    00:00:27.280 00:00:30.280 Caption text #7
+    00:00:30.280 00:00:36.510 Caption text #8
+    00:00:36.510 00:00:38.870 Caption text #9
+    00:00:38.870 00:00:45.000 Caption text #10
+    00:00:45.000 00:00:47.000 Caption text #11
+    00:00:47.000 00:00:50.970 Caption text #12
+    00:00:50.970 00:00:54.440 Caption text #13
+    00:00:54.440 00:00:58.600 Caption text #14
+    00:00:58.600 00:01:01.350 Caption text #15
+    00:01:01.350 00:01:04.300 Caption text #16
+    '''
+    ).strip()
+
+_CONTENT_FORMATTING_VTT = textwrap.dedent(
+    '''
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption test line 1
+    Caption test line 2
+
+    00:00:08.000 --> 00:00:15.000
+    Caption test line 3
+    Caption test line 4
+    '''
+    ).lstrip()
+
+_IDENTIFIERS_LINES = (
+    'WEBVTT',
+    '',
+    '00:00:00.500 --> 00:00:07.000',
+    'Caption text #1',
+    '',
+    'second caption',
+    '00:00:07.000 --> 00:00:11.890',
+    'Caption text #2',
+    '',
+    '00:00:11.890 --> 00:00:16.320',
+    'Caption text #3',
+    '',
+    '4',
+    '00:00:16.320 --> 00:00:21.580',
+    'Caption text #4',
+    '',
+    '00:00:21.580 --> 00:00:23.880',
+    'Caption text #5',
+    '',
+    '00:00:23.880 --> 00:00:27.280',
+    'Caption text #6'
+    )
+
+_COMMENTS_IN_NEW_FILE_VTT = textwrap.dedent(
+    '''
+    WEBVTT
+
+    NOTE This is a header comment
+
+    NOTE
+    where we can see a
+    two line comment
+
+    STYLE
+    ::cue(b) {
+      color: peachpuff;
+    }
+
+    NOTE
+    Another style to test
+    the look and feel
+
+    NOTE Please check
+
+    STYLE
+    ::cue {
+      color: papayawhip;
+    }
+
+    00:00:00.500 --> 00:00:07.000
+    Caption #1
+
+    NOTE
+    Second caption may be a bit off
+    and needs checking
+
+    NOTE Confirm if it displays correctly
+
+    00:00:07.000 --> 00:00:11.890
+    Caption #2
+
+    NOTE This is a footer comment
+
+    NOTE
+    where we can also see a
+    two line comment
+    '''
+    ).strip()
+
 
 class TestWebVTT(unittest.TestCase):
 
+    def tearDown(self):
+        # fails the test that changed one of the shared parsed samples
+        self.assertEqual(_changed_parsed_vtt(), [])
+
     def test_from_string(self):
         vtt = webvtt.from_string(textwrap.dedent("""
             WEBVTT
@@ -55,7 +283,7 @@ class TestWebVTT(unittest.TestCase):
 
     def test_write_captions(self):
         out = io.StringIO()
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
+        vtt = webvtt.from_buffer(_sample_buffer('one_caption.vtt'))
         new_caption = Caption(start='00:00:07.000',
                               end='00:00:11.890',
                               text=['New caption text line1',
@@ -69,21 +297,12 @@ class TestWebVTT(unittest.TestCase):
 
         self.assertEqual(
             out.read(),
-            textwrap.dedent('''
-                WEBVTT
-
-                00:00:00.500 --> 00:00:07.000
-                Caption text #1
-
-                00:00:07.000 --> 00:00:11.890
-                New caption text line1
-                New caption text line2
-            ''').strip() + '\n'
+            _WRITE_CAPTIONS_VTT
             )
 
     def test_write_captions_in_srt(self):
         out = io.StringIO()
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
+        vtt = webvtt.from_buffer(_sample_buffer('one_caption.vtt'))
         new_caption = Caption(start='00:00:07.000',
                               end='00:00:11.890',
                               text=['New caption text line1',
@@ -96,40 +315,18 @@ class TestWebVTT(unittest.TestCase):
         out.seek(0)
         self.assertEqual(
             out.read(),
-            textwrap.dedent('''
-                1
-                00:00:00,500 --> 00:00:07,000
-                Caption text #1
-
-                2
-                00:00:07,000 --> 00:00:11,890
-                New caption text line1
-                New caption text line2
-            ''').strip()
+            _WRITE_CAPTIONS_SRT
             )
 
     def test_write_captions_in_srt_no_cuetags(self):
         """https://github.com/glut23/webvtt-py/issues/56"""
         out = io.StringIO()
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'cue_tags.vtt')
-        vtt.write(out, format='srt')
+        _parsed_vtt('cue_tags.vtt').write(out, format='srt')
 
         out.seek(0)
         self.assertEqual(
             out.read(),
-            textwrap.dedent('''
-            1
-            00:00:16,500 --> 00:00:18,500
-            When the moon hits your eye
-
-            2
-            00:00:18,500 --> 00:00:20,500
-            Like a big-a pizza pie
-
-            3
-            00:00:20,500 --> 00:00:21,500
-            That's amore
-            ''').strip()
+            _CUE_TAGS_SRT
             )
 
     def test_write_captions_in_unsupported_format(self):
@@ -141,11 +338,11 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_save_captions(self):
-        with tempfile.NamedTemporaryFile('w', suffix='.vtt') as f:
-            f.write((PATH_TO_SAMPLES / 'one_caption.vtt').read_text())
-            f.flush()
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / 'one_caption.vtt'
+            path.write_text(_sample_text('one_caption.vtt'), encoding='utf-8')
 
-            vtt = webvtt.read(f.name)
+            vtt = webvtt.read(path)
             new_caption = Caption(start='00:00:07.000',
                                   end='00:00:11.890',
                                   text=['New caption text line1',
@@ -154,26 +351,16 @@ class TestWebVTT(unittest.TestCase):
                                   )
             vtt.captions.append(new_caption)
             vtt.save()
-            f.flush()
 
             self.assertEqual(
-                pathlib.Path(f.name).read_text(),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-
-                    00:00:07.000 --> 00:00:11.890
-                    New caption text line1
-                    New caption text line2
-                    ''').strip() + '\n'
+                path.read_text(encoding='utf-8'),
+                _WRITE_CAPTIONS_VTT
                 )
 
     def test_srt_conversion(self):
         with tempfile.TemporaryDirectory() as td:
             with open(pathlib.Path(td) / 'one_caption.srt', 'w') as f:
-                f.write((PATH_TO_SAMPLES / 'one_caption.srt').read_text())
+                f.write(_sample_text('one_caption.srt'))
 
             webvtt.from_srt(
                 pathlib.Path(td) / 'one_caption.srt'
@@ -184,20 +371,13 @@ class TestWebVTT(unittest.TestCase):
                 )
             self.assertEqual(
                 (pathlib.Path(td) / 'one_caption.vtt').read_text(),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
+                _ONE_CAPTION_VTT
                 )
 
     def test_sbv_conversion(self):
         with tempfile.TemporaryDirectory() as td:
             with open(pathlib.Path(td) / 'two_captions.sbv', 'w') as f:
-                f.write(
-                    (PATH_TO_SAMPLES / 'two_captions.sbv').read_text()
-                    )
+                f.write(_sample_text('two_captions.sbv'))
 
             webvtt.from_sbv(
                 pathlib.Path(td) / 'two_captions.sbv'
@@ -208,51 +388,42 @@ class TestWebVTT(unittest.TestCase):
                 )
             self.assertEqual(
                 (pathlib.Path(td) / 'two_captions.vtt').read_text(),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    00:00:00.378 --> 00:00:11.378
-                    Caption text #1
-
-                    00:00:11.378 --> 00:00:12.305
-                    Caption text #2 (line 1)
-                    Caption text #2 (line 2)
-                    ''').strip() + '\n'
+                _TWO_CAPTIONS_VTT
                 )
 
-    def test_save_to_other_location(self):
+    def test_save_as_srt(self):
         with tempfile.TemporaryDirectory() as td:
             webvtt.read(
                 PATH_TO_SAMPLES / 'one_caption.vtt'
-                ).save(td)
-
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption.vtt')
-                )
+                ).save_as_srt(td)
 
-    def test_save_specific_filename(self):
-        with tempfile.TemporaryDirectory() as td:
-            webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
-                ).save(
-                    pathlib.Path(td) / 'one_caption_new.vtt'
+            self.assertEqual(
+                (pathlib.Path(td) / 'one_caption.srt').read_text(),
+                _sample_text('one_caption.srt')
                 )
 
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption_new.vtt')
-                )
+    def test_save_to_other_location_or_filename(self):
+        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
 
-    def test_save_specific_filename_no_extension(self):
         with tempfile.TemporaryDirectory() as td:
-            webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
-                ).save(
-                    pathlib.Path(td) / 'one_caption_new'
-                )
-
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption_new.vtt')
-                )
+            output_path = pathlib.Path(td)
+            # save() updates vtt.file, the folder goes first so that the
+            # file is still named after the sample
+            for output, expected_file in (
+                    (td, 'one_caption.vtt'),
+                    (output_path / 'one_caption_new.vtt',
+                     'one_caption_new.vtt'
+                     ),
+                    (output_path / 'one_caption_other',
+                     'one_caption_other.vtt'
+                     ),
+                    ):
+                with self.subTest(output=output):
+                    vtt.save(output)
+
+                    self.assertTrue(
+                        os.path.exists(output_path / expected_file)
+                        )
 
     def test_from_buffer(self):
         with open(PATH_TO_SAMPLES / 'sample.vtt', 'r', encoding='utf-8') as f:
@@ -260,25 +431,7 @@ class TestWebVTT(unittest.TestCase):
             self.assertEqual(len(vtt), 16)
             self.assertEqual(
                 str(vtt),
-                textwrap.dedent('''
-                    00:00:00.500 00:00:07.000 Caption text #1
-                    00:00:07.000 00:00:11.890 Caption text #2
-                    00:00:11.890 00:00:16.320 Caption text #3
-                    00:00:16.320 00:00:21.580 Caption text #4
-                    00:00:21.580 00:00:23.880 Caption text #5
-                    00:00:23.880 00:00:27.280 Caption text #6
-                    00:00:27.280 00:00:30.280 Caption text #7
-                    00:00:30.280 00:00:36.510 Caption text #8
-                    00:00:36.510 00:00:38.870 Caption text #9
-                    00:00:38.870 00:00:45.000 Caption text #10
-                    00:00:45.000 00:00:47.000 Caption text #11
-                    00:00:47.000 00:00:50.970 Caption text #12
-                    00:00:50.970 00:00:54.440 Caption text #13
-                    00:00:54.440 00:00:58.600 Caption text #14
-                    00:00:58.600 00:01:01.350 Caption text #15
-                    00:01:01.350 00:01:04.300 Caption text #16
-                    '''
-                    ).strip())
+                _SAMPLE_STR)
 
     def test_deprecated_read_buffer(self):
         with open(PATH_TO_SAMPLES / 'sample.vtt', 'r', encoding='utf-8') as f:
@@ -293,12 +446,8 @@ class TestWebVTT(unittest.TestCase):
                     )
 
     def test_read_memory_buffer(self):
-        buffer = io.StringIO(
-            (PATH_TO_SAMPLES / 'sample.vtt').read_text()
-            )
-
         self.assertIsInstance(
-            webvtt.from_buffer(buffer).captions,
+            webvtt.from_buffer(_sample_buffer('sample.vtt')).captions,
             list
             )
 
@@ -458,16 +607,23 @@ class TestWebVTT(unittest.TestCase):
             '00:00:11.890 00:00:16.320 Caption text #3'
             )
 
-    def test_captions(self):
-        captions = webvtt.read(PATH_TO_SAMPLES / 'sample.vtt').captions
-        self.assertIsInstance(
-            captions,
-            list
-            )
-        self.assertEqual(len(captions), 16)
+    def test_parse_caption_counts(self):
+        for name, expected_count in (
+                ('sample.vtt', 16),
+                ('metadata_headers.vtt', 2),
+                ('metadata_headers_multiline.vtt', 2),
+                ('missing_timeframe.vtt', 6),
+                ('missing_caption_text.vtt', 4),
+                ('invalid_timeframe.vtt', 6),
+                ):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    len(_parsed_vtt(name).captions),
+                    expected_count
+                    )
 
     def test_sequence_iteration(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'sample.vtt')
+        vtt = _parsed_vtt('sample.vtt')
         self.assertIsInstance(vtt[0], Caption)
         self.assertEqual(len(vtt), len(vtt.captions))
 
@@ -493,42 +649,16 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_save_identifiers(self):
-        with tempfile.NamedTemporaryFile('w', suffix='.vtt') as f:
-            webvtt.read(
-                PATH_TO_SAMPLES / 'using_identifiers.vtt'
-                ).save(
-                    f.name
-                    )
+        out = io.StringIO()
+        _parsed_vtt('using_identifiers.vtt').write(out)
 
-            self.assertListEqual(
-                pathlib.Path(f.name).read_text().splitlines(),
-                [
-                    'WEBVTT',
-                    '',
-                    '00:00:00.500 --> 00:00:07.000',
-                    'Caption text #1',
-                    '',
-                    'second caption',
-                    '00:00:07.000 --> 00:00:11.890',
-                    'Caption text #2',
-                    '',
-                    '00:00:11.890 --> 00:00:16.320',
-                    'Caption text #3',
-                    '',
-                    '4',
-                    '00:00:16.320 --> 00:00:21.580',
-                    'Caption text #4',
-                    '',
-                    '00:00:21.580 --> 00:00:23.880',
-                    'Caption text #5',
-                    '',
-                    '00:00:23.880 --> 00:00:27.280',
-                    'Caption text #6'
-                    ]
-                )
+        self.assertListEqual(
+            out.getvalue().splitlines(),
+            list(_IDENTIFIERS_LINES)
+            )
 
     def test_save_updated_identifiers(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'using_identifiers.vtt')
+        vtt = webvtt.from_buffer(_sample_buffer('using_identifiers.vtt'))
         vtt.captions[0].identifier = 'first caption'
         vtt.captions[1].identifier = None
         vtt.captions[3].identifier = '44'
@@ -539,39 +669,23 @@ class TestWebVTT(unittest.TestCase):
         last_caption.identifier = 'last caption'
         vtt.captions.append(last_caption)
 
-        with tempfile.NamedTemporaryFile('w', suffix='.vtt') as f:
-            vtt.save(f.name)
+        out = io.StringIO()
+        vtt.write(out)
 
-            self.assertListEqual(
-                pathlib.Path(f.name).read_text().splitlines(),
-                [
-                    'WEBVTT',
-                    '',
-                    'first caption',
-                    '00:00:00.500 --> 00:00:07.000',
-                    'Caption text #1',
-                    '',
-                    '00:00:07.000 --> 00:00:11.890',
-                    'Caption text #2',
-                    '',
-                    '00:00:11.890 --> 00:00:16.320',
-                    'Caption text #3',
-                    '',
-                    '44',
-                    '00:00:16.320 --> 00:00:21.580',
-                    'Caption text #4',
-                    '',
-                    '00:00:21.580 --> 00:00:23.880',
-                    'Caption text #5',
-                    '',
-                    '00:00:23.880 --> 00:00:27.280',
-                    'Caption text #6',
-                    '',
-                    'last caption',
-                    '00:00:27.280 --> 00:00:29.200',
-                    'Caption text #7'
-                    ]
-                )
+        expected_lines = list(_IDENTIFIERS_LINES)
+        expected_lines.insert(2, 'first caption')
+        expected_lines.remove('second caption')
+        expected_lines[expected_lines.index('4')] = '44'
+        expected_lines.extend(['',
+                               'last caption',
+                               '00:00:27.280 --> 00:00:29.200',
+                               'Caption text #7'
+                               ])
+
+        self.assertListEqual(
+            out.getvalue().splitlines(),
+            expected_lines
+            )
 
     def test_content_formatting(self):
         """
@@ -590,17 +704,7 @@ class TestWebVTT(unittest.TestCase):
 
         self.assertEqual(
             webvtt.WebVTT(captions=captions).content,
-            textwrap.dedent("""
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption test line 1
-                    Caption test line 2
-
-                    00:00:08.000 --> 00:00:15.000
-                    Caption test line 3
-                    Caption test line 4
-                    """).strip() + '\n'
+            _CONTENT_FORMATTING_VTT
             )
 
     def test_repr(self):
@@ -612,32 +716,15 @@ class TestWebVTT(unittest.TestCase):
 
     def test_str(self):
         self.assertEqual(
-            str(webvtt.read(PATH_TO_SAMPLES / 'sample.vtt')),
-            textwrap.dedent("""
-                00:00:00.500 00:00:07.000 Caption text #1
-                00:00:07.000 00:00:11.890 Caption text #2
-                00:00:11.890 00:00:16.320 Caption text #3
-                00:00:16.320 00:00:21.580 Caption text #4
-                00:00:21.580 00:00:23.880 Caption text #5
-                00:00:23.880 00:00:27.280 Caption text #6
-                00:00:27.280 00:00:30.280 Caption text #7
-                00:00:30.280 00:00:36.510 Caption text #8
-                00:00:36.510 00:00:38.870 Caption text #9
-                00:00:38.870 00:00:45.000 Caption text #10
-                00:00:45.000 00:00:47.000 Caption text #11
-                00:00:47.000 00:00:50.970 Caption text #12
-                00:00:50.970 00:00:54.440 Caption text #13
-                00:00:54.440 00:00:58.600 Caption text #14
-                00:00:58.600 00:01:01.350 Caption text #15
-                00:01:01.350 00:01:04.300 Caption text #16
-            """).strip()
+            str(_parsed_vtt('sample.vtt')),
+            _SAMPLE_STR
             )
 
     def test_parse_invalid_file(self):
         self.assertRaises(
             MalformedFileError,
-            webvtt.read,
-            PATH_TO_SAMPLES / 'invalid.vtt'
+            webvtt.from_buffer,
+            _sample_buffer('invalid.vtt')
             )
 
     def test_file_not_found(self):
@@ -649,7 +736,7 @@ class TestWebVTT(unittest.TestCase):
 
     def test_total_length(self):
         self.assertEqual(
-            webvtt.read(PATH_TO_SAMPLES / 'sample.vtt').total_length,
+            _parsed_vtt('sample.vtt').total_length,
             64
             )
 
@@ -662,25 +749,17 @@ class TestWebVTT(unittest.TestCase):
     def test_parse_empty_file(self):
         self.assertRaises(
             MalformedFileError,
-            webvtt.read,
-            PATH_TO_SAMPLES / 'empty.vtt'
-            )
-
-    def test_parse_invalid_timeframe_line(self):
-        good_captions = len(
-            webvtt.read(PATH_TO_SAMPLES / 'invalid_timeframe.vtt').captions
+            webvtt.from_buffer,
+            _sample_buffer('empty.vtt')
             )
-        self.assertEqual(good_captions, 6)
 
     def test_parse_invalid_timeframe_in_cue_text(self):
-        vtt = webvtt.read(
-            PATH_TO_SAMPLES / 'invalid_timeframe_in_cue_text.vtt'
-            )
+        vtt = _parsed_vtt('invalid_timeframe_in_cue_text.vtt')
         self.assertEqual(2, len(vtt.captions))
         self.assertEqual('Caption text #3', vtt.captions[1].text)
 
     def test_parse_get_caption_data(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
+        vtt = _parsed_vtt('one_caption.vtt')
         self.assertEqual(vtt.captions[0].start_in_seconds, 0)
         self.assertEqual(vtt.captions[0].start, '00:00:00.500')
         self.assertEqual(vtt.captions[0].end_in_seconds, 7)
@@ -688,16 +767,8 @@ class TestWebVTT(unittest.TestCase):
         self.assertEqual(vtt.captions[0].lines[0], 'Caption text #1')
         self.assertEqual(len(vtt.captions[0].lines), 1)
 
-    def test_caption_without_timeframe(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'missing_timeframe.vtt')
-        self.assertEqual(len(vtt.captions), 6)
-
-    def test_caption_without_cue_text(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'missing_caption_text.vtt')
-        self.assertEqual(len(vtt.captions), 4)
-
     def test_timestamps_format(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'sample.vtt')
+        vtt = _parsed_vtt('sample.vtt')
         self.assertEqual(vtt.captions[2].start, '00:00:11.890')
         self.assertEqual(vtt.captions[2].end, '00:00:16.320')
 
@@ -710,16 +781,8 @@ class TestWebVTT(unittest.TestCase):
     def test_captions_attribute(self):
         self.assertListEqual(webvtt.WebVTT().captions, [])
 
-    def test_metadata_headers(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'metadata_headers.vtt')
-        self.assertEqual(len(vtt.captions), 2)
-
-    def test_metadata_headers_multiline(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'metadata_headers_multiline.vtt')
-        self.assertEqual(len(vtt.captions), 2)
-
     def test_parse_identifiers(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'using_identifiers.vtt')
+        vtt = _parsed_vtt('using_identifiers.vtt')
         self.assertEqual(len(vtt.captions), 6)
 
         self.assertEqual(vtt.captions[1].identifier, 'second caption')
@@ -727,7 +790,7 @@ class TestWebVTT(unittest.TestCase):
         self.assertEqual(vtt.captions[3].identifier, '4')
 
     def test_parse_comments(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'comments.vtt')
+        vtt = _parsed_vtt('comments.vtt')
         self.assertEqual(len(vtt.captions), 3)
         self.assertListEqual(
             vtt.captions[0].lines,
@@ -762,7 +825,7 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_parse_styles(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'styles.vtt')
+        vtt = _parsed_vtt('styles.vtt')
         self.assertEqual(len(vtt.captions), 1)
         self.assertEqual(
             vtt.styles[0].text,
@@ -771,7 +834,7 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_parse_styles_with_comments(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'styles_with_comments.vtt')
+        vtt = _parsed_vtt('styles_with_comments.vtt')
         self.assertEqual(len(vtt.captions), 1)
         self.assertEqual(len(vtt.styles), 2)
         self.assertEqual(
@@ -896,89 +959,47 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_comments_in_new_file(self):
-        with tempfile.NamedTemporaryFile('r', suffix='.vtt') as f:
-            vtt = webvtt.WebVTT()
-            vtt.header_comments.append('This is a header comment')
-            vtt.header_comments.append(
-                'where we can see a\ntwo line comment'
-                )
-            vtt.styles.append(
-                Style('::cue(b) {\n  color: peachpuff;\n}')
-                )
-            style = Style('::cue {\n  color: papayawhip;\n}')
-            style.comments.append('Another style to test\nthe look and feel')
-            style.comments.append('Please check')
-            vtt.styles.append(style)
-            vtt.captions.append(
-                Caption(start='00:00:00.500',
-                        end='00:00:07.000',
-                        text='Caption #1',
-                        )
-                )
-            caption = Caption(start='00:00:07.000',
-                              end='00:00:11.890',
-                              text='Caption #2'
-                              )
-            caption.comments.append(
-                'Second caption may be a bit off\nand needs checking'
-                )
-            caption.comments.append('Confirm if it displays correctly')
-            vtt.captions.append(caption)
-            vtt.footer_comments.append('This is a footer comment')
-            vtt.footer_comments.append(
-                'where we can also see a\ntwo line comment'
-                )
-
-            vtt.save(f.name)
-            self.assertEqual(
-                f.read(),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    NOTE This is a header comment
-
-                    NOTE
-                    where we can see a
-                    two line comment
-
-                    STYLE
-                    ::cue(b) {
-                      color: peachpuff;
-                    }
-
-                    NOTE
-                    Another style to test
-                    the look and feel
-
-                    NOTE Please check
-
-                    STYLE
-                    ::cue {
-                      color: papayawhip;
-                    }
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption #1
-
-                    NOTE
-                    Second caption may be a bit off
-                    and needs checking
-
-                    NOTE Confirm if it displays correctly
-
-                    00:00:07.000 --> 00:00:11.890
-                    Caption #2
-
-                    NOTE This is a footer comment
+        out = io.StringIO()
+        vtt = webvtt.WebVTT()
+        vtt.header_comments.append('This is a header comment')
+        vtt.header_comments.append(
+            'where we can see a\ntwo line comment'
+            )
+        vtt.styles.append(
+            Style('::cue(b) {\n  color: peachpuff;\n}')
+            )
+        style = Style('::cue {\n  color: papayawhip;\n}')
+        style.comments.append('Another style to test\nthe look and feel')
+        style.comments.append('Please check')
+        vtt.styles.append(style)
+        vtt.captions.append(
+            Caption(start='00:00:00.500',
+                    end='00:00:07.000',
+                    text='Caption #1',
+                    )
+            )
+        caption = Caption(start='00:00:07.000',
+                          end='00:00:11.890',
+                          text='Caption #2'
+                          )
+        caption.comments.append(
+            'Second caption may be a bit off\nand needs checking'
+            )
+        caption.comments.append('Confirm if it displays correctly')
+        vtt.captions.append(caption)
+        vtt.footer_comments.append('This is a footer comment')
+        vtt.footer_comments.append(
+            'where we can also see a\ntwo line comment'
+            )
 
-                    NOTE
-                    where we can also see a
-                    two line comment
-                    ''').strip()
-                )
+        vtt.write(out)
+        self.assertEqual(
+            out.getvalue(),
+            _COMMENTS_IN_NEW_FILE_VTT
+            )
 
     def test_clean_cue_tags(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'cue_tags.vtt')
+        vtt = _parsed_vtt('cue_tags.vtt')
         self.assertEqual(
             vtt.captions[1].text,
             'Like a big-a pizza pie'
@@ -993,7 +1014,7 @@ class TestWebVTT(unittest.TestCase):
         self.assertEqual(len(vtt.captions), 4)
 
     def test_empty_lines_are_not_included_in_result(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'netflix_chicas_del_cable.vtt')
+        vtt = _parsed_vtt('netflix_chicas_del_cable.vtt')
         self.assertEqual(vtt.captions[0].text, "[Alba] En 1928,")
         self.assertEqual(
             vtt.captions[-2].text,
@@ -1001,7 +1022,7 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_can_parse_youtube_dl_files(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'youtube_dl.vtt')
+        vtt = _parsed_vtt('youtube_dl.vtt')
         self.assertEqual(
             "this will happen is I'm telling\n ",
             vtt.captions[2].text
@@ -1065,6 +1086,11 @@ class TestWebVTT(unittest.TestCase):
 
 class TestParseSRT(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # parsed once for the tests that only read from it
+        cls.sample_srt = webvtt.from_srt(PATH_TO_SAMPLES / 'sample.srt')
+
     def test_parse_empty_file(self):
         self.assertRaises(
             webvtt.errors.MalformedFileError,
@@ -1075,21 +1101,23 @@ class TestParseSRT(unittest.TestCase):
 
     def test_invalid_format(self):
         for i in range(1, 5):
-            self.assertRaises(
-                MalformedFileError,
-                webvtt.from_srt,
-                PATH_TO_SAMPLES / f'invalid_format{i}.srt'
-                )
+            with self.subTest(i=i):
+                self.assertRaises(
+                    MalformedFileError,
+                    webvtt.from_buffer,
+                    _sample_buffer(f'invalid_format{i}.srt'),
+                    format='srt'
+                    )
 
     def test_total_length(self):
         self.assertEqual(
-            webvtt.from_srt(PATH_TO_SAMPLES / 'sample.srt').total_length,
+            self.sample_srt.total_length,
             23
             )
 
     def test_parse_captions(self):
         self.assertTrue(
-            webvtt.from_srt(PATH_TO_SAMPLES / 'sample.srt').captions
+            self.sample_srt.captions
             )
 
     def test_missing_timeframe_line(self):
@@ -1121,7 +1149,7 @@ class TestParseSRT(unittest.TestCase):
             )
 
     def test_timestamps_format(self):
-        vtt = webvtt.from_srt(PATH_TO_SAMPLES / 'sample.srt')
+        vtt = self.sample_srt
         self.assertEqual(vtt.captions[2].start, '00:00:11.890')
         self.assertEqual(vtt.captions[2].end, '00:00:16.320')
 
@@ -1137,6 +1165,15 @@ class TestParseSRT(unittest.TestCase):
 
 class TestParseSBV(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # parsed once for the tests that only read from it
+        cls.sample_sbv = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+
+    def tearDown(self):
+        # fails the test that changed one of the shared parsed samples
+        self.assertEqual(_changed_parsed_vtt(), [])
+
     def test_parse_empty_file(self):
         self.assertRaises(
             MalformedFileError,
@@ -1154,13 +1191,13 @@ class TestParseSBV(unittest.TestCase):
 
     def test_total_length(self):
         self.assertEqual(
-            webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv').total_length,
+            self.sample_sbv.total_length,
             16
             )
 
     def test_parse_captions(self):
         self.assertEqual(
-            len(webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv').captions),
+            len(self.sample_sbv.captions),
             5
             )
 
@@ -1188,21 +1225,21 @@ class TestParseSBV(unittest.TestCase):
             )
 
     def test_timestamps_format(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(vtt.captions[1].start, '00:00:11.378')
         self.assertEqual(vtt.captions[1].end, '00:00:12.305')
 
     def test_timestamps_in_seconds(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(vtt.captions[1].start_in_seconds, 11)
         self.assertEqual(vtt.captions[1].end_in_seconds, 12)
 
     def test_get_caption_text(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(vtt.captions[1].text, 'Caption text #2')
 
     def test_get_caption_text_multiline(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(
             vtt.captions[2].text,
             'Caption text #3 (line 1)\nCaption text #3 (line 2)'
@@ -1213,15 +1250,16 @@ class TestParseSBV(unittest.TestCase):
             )
 
     def test_convert_from_srt_to_vtt_and_back_gives_same_file(self):
-        with tempfile.NamedTemporaryFile('w', suffix='.srt') as f:
-            webvtt.from_srt(
-                PATH_TO_SAMPLES / 'sample.srt'
-                ).save_as_srt(f.name)
+        out = io.StringIO()
+        webvtt.from_buffer(
+            _sample_buffer('sample.srt'),
+            format='srt'
+            ).write(out, format='srt')
 
-            self.assertEqual(
-                pathlib.Path(PATH_TO_SAMPLES / 'sample.srt').read_text(),
-                pathlib.Path(f.name).read_text()
-                )
+        self.assertEqual(
+            _sample_text('sample.srt'),
+            out.getvalue()
+            )
 
     def test_save_file_with_bom(self):
         with tempfile.NamedTemporaryFile('r', suffix='.vtt') as f:
@@ -1230,12 +1268,7 @@ class TestParseSBV(unittest.TestCase):
                 ).save(f.name, add_bom=True)
             self.assertEqual(
                 f.read(),
-                textwrap.dedent(f'''
-                    {CODEC_BOMS['utf-8'].decode()}WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
+                _UTF8_BOM + _ONE_CAPTION_VTT
                 )
 
     def test_save_file_with_bom_keeps_bom(self):
@@ -1245,21 +1278,7 @@ class TestParseSBV(unittest.TestCase):
             ).save(f.name)
             self.assertEqual(
                 f.read(),
-                textwrap.dedent(f'''
-                    {CODEC_BOMS['utf-8'].decode()}WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-
-                    00:00:07.000 --> 00:00:11.890
-                    Caption text #2
-
-                    00:00:11.890 --> 00:00:16.320
-                    Caption text #3
-
-                    00:00:16.320 --> 00:00:21.580
-                    Caption text #4
-                    ''').strip() + '\n'
+                _UTF8_BOM + _FOUR_CAPTIONS_VTT
                 )
 
     def test_save_file_with_bom_removes_bom_if_requested(self):
@@ -1269,21 +1288,7 @@ class TestParseSBV(unittest.TestCase):
             ).save(f.name, add_bom=False)
             self.assertEqual(
                 f.read(),
-                textwrap.dedent(f'''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-
-                    00:00:07.000 --> 00:00:11.890
-                    Caption text #2
-
-                    00:00:11.890 --> 00:00:16.320
-                    Caption text #3
-
-                    00:00:16.320 --> 00:00:21.580
-                    Caption text #4
-                    ''').strip() + '\n'
+                _FOUR_CAPTIONS_VTT
                 )
 
     def test_save_file_with_encoding(self):
@@ -1295,12 +1300,7 @@ class TestParseSBV(unittest.TestCase):
                    )
             self.assertEqual(
                 f.read().decode('utf-32-le'),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
+                _ONE_CAPTION_VTT
                 )
 
     def test_save_file_with_encoding_and_bom(self):
@@ -1313,12 +1313,7 @@ class TestParseSBV(unittest.TestCase):
                    )
             self.assertEqual(
                 f.read().decode('utf-32-le'),
-                textwrap.dedent(f'''
-                    {CODEC_BOMS['utf-32-le'].decode('utf-32-le')}WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
+                CODEC_BOMS['utf-32-le'].decode('utf-32-le') + _ONE_CAPTION_VTT
                 )
 
     def test_save_new_file_utf_8_default_encoding_no_bom(self):
@@ -1334,12 +1329,7 @@ class TestParseSBV(unittest.TestCase):
             self.assertEqual(vtt.encoding, 'utf-8')
             self.assertEqual(
                 f.read(),
-                textwrap.dedent(f'''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
+                _ONE_CAPTION_VTT
                 )
 
     def test_save_new_file_utf_8_default_encoding_with_bom(self):
@@ -1357,18 +1347,11 @@ class TestParseSBV(unittest.TestCase):
             self.assertEqual(vtt.encoding, 'utf-8')
             self.assertEqual(
                 f.read(),
-                textwrap.dedent(f'''
-                    {CODEC_BOMS['utf-8'].decode()}WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
+                _UTF8_BOM + _ONE_CAPTION_VTT
                 )
 
     def test_iter_slice(self):
-        vtt = webvtt.read(
-                PATH_TO_SAMPLES / 'sample.vtt'
-                )
+        vtt = _parsed_vtt('sample.vtt')
         slice_of_captions = vtt.iter_slice(start='00:00:11.000',
                                            end='00:00:27.000'
                                            )
@@ -1382,9 +1365,7 @@ class TestParseSBV(unittest.TestCase):
             next(slice_of_captions)
 
     def test_iter_slice_no_start_time(self):
-        vtt = webvtt.read(
-                PATH_TO_SAMPLES / 'sample.vtt'
-                )
+        vtt = _parsed_vtt('sample.vtt')
         slice_of_captions = vtt.iter_slice(end='00:00:27.000')
         for expected_caption in (vtt.captions[0],
                                  vtt.captions[1],
@@ -1398,9 +1379,7 @@ class TestParseSBV(unittest.TestCase):
             next(slice_of_captions)
 
     def test_iter_slice_no_end_time(self):
-        vtt = webvtt.read(
-                PATH_TO_SAMPLES / 'sample.vtt'
-                )
+        vtt = _parsed_vtt('sample.vtt')
         slice_of_captions = vtt.iter_slice(start='00:00:47.000')
         for expected_caption in (vtt.captions[11],
                                  vtt.captions[12],
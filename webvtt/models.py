@@ -2,14 +2,83 @@
 
 import re
 import typing
+from functools import lru_cache, wraps
 
 from .errors import MalformedCaptionError
 
+_TIMESTAMP_RE = re.compile(r'(?:(\d{1,2}):)?(\d{1,2}):(\d{1,2})\.(\d{3})')
+_CUE_TEXT_TAGS_RE = re.compile('<.*?>')
+_VOICE_SPAN_RE = re.compile(r'<v(?:\.\w+)*\s+([^>]+)>')
+
+
+def _is_canonical_timestamp(value: str) -> bool:
+    """
+    Check if the value is a timestamp in the fixed HH:MM:SS.mmm form.
+
+    :param value: the timestamp string
+    :returns: true if the value has the fixed form
+    """
+    return (len(value) == 12 and
+            value.isascii() and
+            value[2] == ':' and
+            value[5] == ':' and
+            value[8] == '.' and
+            (value[0:2] + value[3:5] + value[6:8] + value[9:12]).isdecimal()
+            )
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(
+        value: str,
+        pattern: typing.Union[str, typing.Pattern[str]] = _TIMESTAMP_RE
+        ) -> typing.Tuple[int, int, int, int]:
+    """
+    Parse a timestamp string into its components.
+
+    Results are cached as caption files repeat the same timestamps, e.g. the
+    end of a caption is usually the start of the next one.
+
+    :param value: the timestamp string
+    :param pattern: the timestamp pattern, `Timestamp.PATTERN` by default
+    :returns: tuple of hours, minutes, seconds and milliseconds
+
+    :raises MalformedCaptionError: if the value is not a valid timestamp
+    """
+    if pattern is _TIMESTAMP_RE and _is_canonical_timestamp(value):
+        # fast path for the common HH:MM:SS.mmm form, no regex needed and
+        # the ASCII digits are converted from their code points instead of
+        # slicing the value for int(), 528 and 5328 remove the offset of
+        # ord('0') from two and three digit numbers
+        digits = value.encode('ascii')
+        hours = digits[0] * 10 + digits[1] - 528
+        minutes = digits[3] * 10 + digits[4] - 528
+        seconds = digits[6] * 10 + digits[7] - 528
+        milliseconds = (digits[9] * 100 + digits[10] * 10 + digits[11] -
+                        5328
+                        )
+    else:
+        match = re.fullmatch(pattern, value)
+        if match is None:
+            raise MalformedCaptionError(f'Invalid timestamp {value!r}')
+
+        hours = int(match.group(1) or 0)
+        minutes = int(match.group(2))
+        seconds = int(match.group(3))
+        milliseconds = int(match.group(4))
+
+    if minutes > 59 or seconds > 59:
+        raise MalformedCaptionError(f'Invalid timestamp {value!r}')
+
+    return hours, minutes, seconds, milliseconds
+
 
 class Timestamp:
     """Representation of a timestamp."""
 
-    PATTERN = re.compile(r'(?:(\d{1,2}):)?(\d{1,2}):(\d{1,2})\.(\d{3})')
+    __slots__ = ('_hours', '_minutes', '_seconds', '_milliseconds', '_key',
+                 '_str')
+
+    PATTERN = _TIMESTAMP_RE
 
     def __init__(
             self,
@@ -19,21 +88,77 @@ class Timestamp:
             milliseconds: int = 0
             ):
         """Initialize."""
-        self.hours = hours
-        self.minutes = minutes
-        self.seconds = seconds
-        self.milliseconds = milliseconds
+        self._hours = hours
+        self._minutes = minutes
+        self._seconds = seconds
+        self._milliseconds = milliseconds
+        self._reset()
+
+    def _reset(self):
+        """Recompute the comparison key and drop the cached string form."""
+        # total milliseconds, used for comparisons and hashing
+        self._key = (
+            ((self._hours * 60 + self._minutes) * 60 + self._seconds) * 1000 +
+            self._milliseconds
+            )
+        # string form, built on first use
+        self._str: typing.Optional[str] = None
+
+    @property
+    def hours(self) -> int:
+        """Return the hours of the timestamp."""
+        return self._hours
+
+    @hours.setter
+    def hours(self, value: int):
+        """Set the hours of the timestamp."""
+        self._hours = value
+        self._reset()
+
+    @property
+    def minutes(self) -> int:
+        """Return the minutes of the timestamp."""
+        return self._minutes
+
+    @minutes.setter
+    def minutes(self, value: int):
+        """Set the minutes of the timestamp."""
+        self._minutes = value
+        self._reset()
+
+    @property
+    def seconds(self) -> int:
+        """Return the seconds of the timestamp."""
+        return self._seconds
+
+    @seconds.setter
+    def seconds(self, value: int):
+        """Set the seconds of the timestamp."""
+        self._seconds = value
+        self._reset()
+
+    @property
+    def milliseconds(self) -> int:
+        """Return the milliseconds of the timestamp."""
+        return self._milliseconds
+
+    @milliseconds.setter
+    def milliseconds(self, value: int):
+        """Set the milliseconds of the timestamp."""
+        self._milliseconds = value
+        self._reset()
 
     def __str__(self):
         """Return the string representation of the timestamp."""
-        return (
-            f'{self.hours:02d}:{self.minutes:02d}:{self.seconds:02d}'
-            f'.{self.milliseconds:03d}'
-            )
+        if self._str is None:
+            self._str = (f'{self._hours:02d}:{self._minutes:02d}:'
+                         f'{self._seconds:02d}.{self._milliseconds:03d}'
+                         )
+        return self._str
 
     def to_tuple(self) -> typing.Tuple[int, int, int, int]:
         """Return the timestamp in tuple form."""
-        return self.hours, self.minutes, self.seconds, self.milliseconds
+        return self._hours, self._minutes, self._seconds, self._milliseconds
 
     def __repr__(self):
         """Return the string representation of the caption."""
@@ -46,27 +171,31 @@ class Timestamp:
 
     def __eq__(self, other):
         """Compare equality with other object."""
-        return self.to_tuple() == other.to_tuple()
+        return self._key == other._key
 
     def __ne__(self, other):
         """Compare a not equality with other object."""
-        return self.to_tuple() != other.to_tuple()
+        return self._key != other._key
 
     def __gt__(self, other):
         """Compare greater than with other object."""
-        return self.to_tuple() > other.to_tuple()
+        return self._key > other._key
 
     def __lt__(self, other):
         """Compare less than with other object."""
-        return self.to_tuple() < other.to_tuple()
+        return self._key < other._key
 
     def __ge__(self, other):
         """Compare greater or equal with other object."""
-        return self.to_tuple() >= other.to_tuple()
+        return self._key >= other._key
 
     def __le__(self, other):
         """Compare less or equal with other object."""
-        return self.to_tuple() <= other.to_tuple()
+        return self._key <= other._key
+
+    def __hash__(self):
+        """Return the hash of the timestamp."""
+        return hash(self._key)
 
     @classmethod
     def from_string(cls, value: str) -> 'Timestamp':
@@ -74,33 +203,72 @@ class Timestamp:
         if type(value) is not str:
             raise MalformedCaptionError(f'Invalid timestamp {value!r}')
 
-        match = re.match(cls.PATTERN, value)
-        if not match:
-            raise MalformedCaptionError(f'Invalid timestamp {value!r}')
+        timestamp = cls(*_parse_timestamp(value, cls.PATTERN))
+        if (cls.PATTERN is _TIMESTAMP_RE and
+                len(value) == 12 and value.isascii()):
+            # valid ASCII timestamps of this length are in the HH:MM:SS.mmm
+            # form produced by __str__, so the value is reused as is, \d
+            # also matches non-ASCII digits that __str__ writes as ASCII
+            timestamp._str = value
+        return timestamp
 
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2))
-        seconds = int(match.group(3))
-        milliseconds = int(match.group(4))
+    def in_seconds(self) -> int:
+        """Return the timestamp in seconds."""
+        return self._key // 1000
 
-        if minutes > 59 or seconds > 59:
-            raise MalformedCaptionError(f'Invalid timestamp {value!r}')
 
-        return cls(hours, minutes, seconds, milliseconds)
+def _invalidate_joined(method):
+    """Wrap a list method so that it clears the cached joined text."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._text = None
+        return method(self, *args, **kwargs)
+    return wrapper
 
-    def in_seconds(self) -> int:
-        """Return the timestamp in seconds."""
-        return (self.hours * 3600 +
-                self.minutes * 60 +
-                self.seconds
-                )
+
+class _Lines(list):
+    """List of lines that caches its text joined by line breaks."""
+
+    __slots__ = ('_text',)
+
+    def __init__(self, iterable: typing.Iterable[str] = ()):
+        """
+        Initialize.
+
+        :param iterable: the lines
+        """
+        super().__init__(iterable)
+        self._text: typing.Optional[str] = None
+
+    def joined(self) -> str:
+        """Return the lines joined by line breaks."""
+        if self._text is None:
+            self._text = '\n'.join(self)
+        return self._text
+
+    # the methods changing the list clear the cached joined text
+    __setitem__ = _invalidate_joined(list.__setitem__)
+    __delitem__ = _invalidate_joined(list.__delitem__)
+    __iadd__ = _invalidate_joined(list.__iadd__)
+    __imul__ = _invalidate_joined(list.__imul__)
+    append = _invalidate_joined(list.append)
+    extend = _invalidate_joined(list.extend)
+    insert = _invalidate_joined(list.insert)
+    pop = _invalidate_joined(list.pop)
+    remove = _invalidate_joined(list.remove)
+    clear = _invalidate_joined(list.clear)
+    sort = _invalidate_joined(list.sort)
+    reverse = _invalidate_joined(list.reverse)
 
 
 class Caption:
     """Representation of a caption."""
 
-    CUE_TEXT_TAGS = re.compile('<.*?>')
-    VOICE_SPAN_PATTERN = re.compile(r'<v(?:\.\w+)*\s+([^>]+)>')
+    __slots__ = ('start_time', 'end_time', 'identifier', '_lines', '_comments',
+                 '_text')
+
+    CUE_TEXT_TAGS = _CUE_TEXT_TAGS_RE
+    VOICE_SPAN_PATTERN = _VOICE_SPAN_RE
 
     def __init__(self,
                  start: typing.Optional[str] = None,
@@ -119,15 +287,69 @@ class Caption:
         :param identifier: optional identifier
         """
         text = text or []
-        self.start = start or '00:00:00.000'
-        self.end = end or '00:00:00.000'
+        self._init_slots(Timestamp.from_string(start or '00:00:00.000'),
+                         Timestamp.from_string(end or '00:00:00.000'),
+                         text.splitlines() if isinstance(text, str) else text,
+                         identifier
+                         )
+
+    def _init_slots(
+            self,
+            start_time: Timestamp,
+            end_time: Timestamp,
+            lines: typing.Iterable[str],
+            identifier: typing.Optional[str]
+            ):
+        """
+        Set all the slots of the caption.
+
+        Shared by `__init__` and `from_records`.
+
+        :param start_time: start time of the caption
+        :param end_time: end time of the caption
+        :param lines: the lines of text
+        :param identifier: optional identifier
+        """
+        self.start_time = start_time
+        self.end_time = end_time
         self.identifier = identifier
-        self.lines = (text.splitlines()
-                      if isinstance(text, str)
-                      else
-                      list(text)
-                      )
-        self.comments: typing.List[str] = []
+        self._lines = _Lines(lines)
+        # most captions have no comments, the list is created on demand
+        self._comments: typing.Optional[typing.List[str]] = None
+        # raw text and its version without cue tags
+        self._text: typing.Optional[typing.Tuple[str, str]] = None
+
+    @classmethod
+    def from_records(
+            cls,
+            records: typing.Iterable[
+                typing.Tuple[str, str, typing.Sequence[str],
+                             typing.Optional[str]]
+                ]
+            ) -> typing.List['Caption']:
+        """
+        Create captions in bulk from records.
+
+        Intended for parsers: each record provides the start and end
+        timestamps, the lines of text and the identifier, so the defaults
+        handling of `__init__` is skipped.
+
+        :param records: iterable of (start, end, lines, identifier) tuples
+        :returns: list of `Caption` objects
+        """
+        captions = []
+        from_string = Timestamp.from_string
+
+        for start, end, lines, identifier in records:
+            caption = cls.__new__(cls)
+            caption._init_slots(from_string(start),
+                                from_string(end),
+                                lines,
+                                identifier
+                                )
+            captions.append(caption)
+
+        return captions
 
     def __repr__(self):
         """Return the string representation of the caption."""
@@ -142,15 +364,15 @@ class Caption:
     def __str__(self):
         """Return a readable representation of the caption."""
         cleaned_text = self.text.replace('\n', '\\n')
-        return f'{self.start} {self.end} {cleaned_text}'
+        return f'{self.start_time} {self.end_time} {cleaned_text}'
 
     def __eq__(self, other):
         """Compare equality with another object."""
         if not isinstance(other, type(self)):
             return False
 
-        return (self.start == other.start and
-                self.end == other.end and
+        return (self.start_time == other.start_time and
+                self.end_time == other.end_time and
                 self.raw_text == other.raw_text and
                 self.identifier == other.identifier
                 )
@@ -185,15 +407,54 @@ class Caption:
         """Return the end time of the caption in seconds."""
         return self.end_time.in_seconds()
 
+    @property
+    def lines(self) -> typing.List[str]:
+        """Return the lines of the caption."""
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: typing.Iterable[str]):
+        """Set the lines of the caption."""
+        self._lines = _Lines(value)
+
+    @property
+    def comments(self) -> typing.List[str]:
+        """Return the comments of the caption."""
+        if self._comments is None:
+            self._comments = []
+        return self._comments
+
+    @comments.setter
+    def comments(self, value: typing.List[str]):
+        """Set the comments of the caption."""
+        self._comments = value
+
+    @property
+    def has_comments(self) -> bool:
+        """Return true if the caption has comments."""
+        # checks the slot directly so no empty list is created
+        return bool(self._comments)
+
     @property
     def raw_text(self) -> str:
         """Return the text of the caption (including cue tags)."""
-        return '\n'.join(self.lines)
+        return self._lines.joined()
 
     @property
     def text(self) -> str:
         """Return the text of the caption (without cue tags)."""
-        return re.sub(self.CUE_TEXT_TAGS, '', self.raw_text)
+        raw_text = self.raw_text
+        # the raw text is cached by the lines until they change, so the
+        # same object means the cue tags were already removed from it
+        if self._text is None or self._text[0] is not raw_text:
+            cue_text_tags = self.CUE_TEXT_TAGS
+            self._text = (raw_text,
+                          raw_text
+                          if (cue_text_tags is _CUE_TEXT_TAGS_RE and
+                              '<' not in raw_text) else
+                          re.sub(cue_text_tags, '', raw_text)
+                          )
+        return self._text[1]
 
     @text.setter
     def text(self, value: str):
@@ -203,7 +464,7 @@ class Caption:
                 f'String value expected but received {value}.'
                 )
 
-        self.lines = value.splitlines()
+        self._lines = _Lines(value.splitlines())
 
     @property
     def voice(self) -> typing.Optional[str]:
@@ -219,6 +480,8 @@ class Caption:
 class Style:
     """Representation of a style."""
 
+    __slots__ = ('lines', 'comments')
+
     def __init__(self, text: typing.Union[str, typing.List[str]]):
         """Initialize.
 
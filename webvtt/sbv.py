@@ -11,6 +11,8 @@ from .errors import MalformedFileError
 class SBVCueBlock:
     """Representation of a cue timing block."""
 
+    __slots__ = ('start', 'end', 'payload')
+
     CUE_TIMINGS_PATTERN = re.compile(
         r'\s*(\d{1,2}:\d{1,2}:\d{1,2}.\d{3}),(\d{1,2}:\d{1,2}:\d{1,2}.\d{3})'
         )
@@ -45,7 +47,8 @@ class SBVCueBlock:
         """
         return bool(
           len(lines) >= 2 and
-          re.match(cls.CUE_TIMINGS_PATTERN, lines[0]) and
+          ',' in lines[0] and
+          cls.CUE_TIMINGS_PATTERN.match(lines[0]) and
           lines[1].strip()
           )
 
@@ -60,7 +63,7 @@ class SBVCueBlock:
         :param lines: the lines of text
         :returns: `SBVCueBlock` instance
         """
-        match = re.match(cls.CUE_TIMINGS_PATTERN, lines[0])
+        match = cls.CUE_TIMINGS_PATTERN.match(lines[0])
         assert match is not None
 
         payload = lines[1:]
@@ -102,16 +105,18 @@ def _parse_captions(lines: typing.Sequence[str]) -> typing.List[Caption]:
     :param lines: lines of text
     :returns: list of `Caption` objects
     """
-    captions = []
+    records = []
 
     for block_lines in utils.iter_blocks_of_lines(lines):
         if not SBVCueBlock.is_valid(block_lines):
             continue
 
         cue_block = SBVCueBlock.from_lines(block_lines)
-        captions.append(Caption(cue_block.start,
-                                cue_block.end,
-                                cue_block.payload
-                                ))
 
-    return captions
+        records.append((cue_block.start,
+                        cue_block.end,
+                        cue_block.payload,
+                        None
+                        ))
+
+    return Caption.from_records(records)
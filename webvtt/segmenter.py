@@ -10,6 +10,14 @@ from .webvtt import WebVTT, Caption
 DEFAULT_MPEGTS = 900000
 DEFAULT_SECONDS = 10  # default number of seconds per segment
 
+_MANIFEST_HEADER = (
+    '#EXTM3U\n'
+    '#EXT-X-TARGETDURATION:{seconds}\n'
+    '#EXT-X-VERSION:3\n'
+    '#EXT-X-PLAYLIST-TYPE:VOD\n'
+    )
+_MANIFEST_FOOTER = '#EXT-X-ENDLIST\n'
+
 
 def segment(
         webvtt_path: str,
@@ -81,18 +89,44 @@ def write_segments(
     :param segments: the segments of `Caption` objects
     :param mpegts: value for the MPEG-TS
     """
+    # the header is the same for all the segments
+    header = f'WEBVTT\nX-TIMESTAMP-MAP=MPEGTS:{mpegts},LOCAL:00:00:00.000'
+    # plain string paths, no Path object is built for each segment
+    path_prefix = os.path.join(output_folder, 'fileSequence')
+
     for index, segment in enumerate(segments):
-        segment_file = output_folder / f'fileSequence{index}.webvtt'
+        lines = [header]
+
+        for caption in segment:
+            lines.extend([
+                '',
+                f'{caption.start} --> {caption.end}',
+                *caption.lines
+                ])
+
+        _write_file(
+            f'{path_prefix}{index}.webvtt',
+            '\n'.join(lines) + '\n'
+            )
 
-        with open(segment_file, 'w', encoding='utf-8') as f:
-            f.write('WEBVTT\n')
-            f.write(f'X-TIMESTAMP-MAP=MPEGTS:{mpegts},'
-                    'LOCAL:00:00:00.000\n'
-                    )
 
-            for caption in segment:
-                f.write('\n{} --> {}\n'.format(caption.start, caption.end))
-                f.writelines(f'{line}\n' for line in caption.lines)
+def _write_file(path: str, content: str):
+    """
+    Write the content to a file in a single system call.
+
+    Segment files are small, so the content is encoded at once and handed
+    to the OS without going through a buffered text stream.
+
+    :param path: path of the file
+    :param content: the content of the file
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        data = memoryview(content.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def write_manifest(
@@ -107,15 +141,12 @@ def write_manifest(
     :param segments: the segments of `Caption` objects
     :param seconds: the seconds per segment
     """
-    manifest_file = output_folder / 'prog_index.m3u8'
-    with open(manifest_file, 'w', encoding='utf-8') as f:
-        f.write('#EXTM3U\n')
-        f.write(f'#EXT-X-TARGETDURATION:{seconds}\n')
-        f.write('#EXT-X-VERSION:3\n')
-        f.write('#EXT-X-PLAYLIST-TYPE:VOD\n')
-
-        for index, _ in enumerate(segments):
-            f.write('#EXTINF:30.00000\n')
-            f.write(f'fileSequence{index}.webvtt\n')
-
-        f.write('#EXT-X-ENDLIST\n')
+    content = ''.join((
+        _MANIFEST_HEADER.format(seconds=seconds),
+        *(f'#EXTINF:30.00000\nfileSequence{index}.webvtt\n'
+          for index, _ in enumerate(segments)
+          ),
+        _MANIFEST_FOOTER
+        ))
+
+    _write_file(os.path.join(output_folder, 'prog_index.m3u8'), content)
@@ -11,6 +11,8 @@ from . import utils
 class SRTCueBlock:
     """Representation of a cue timing block."""
 
+    __slots__ = ('index', 'start', 'end', 'payload')
+
     CUE_TIMINGS_PATTERN = re.compile(
         r'\s*(\d+:\d{2}:\d{2},\d{3})\s*-->\s*(\d+:\d{2}:\d{2},\d{3})'
         )
@@ -48,7 +50,7 @@ class SRTCueBlock:
         return bool(
           len(lines) >= 3 and
           lines[0].isdigit() and
-          re.match(cls.CUE_TIMINGS_PATTERN, lines[1])
+          cls.CUE_TIMINGS_PATTERN.match(lines[1])
           )
 
     @classmethod
@@ -64,7 +66,7 @@ class SRTCueBlock:
         """
         index = lines[0]
 
-        match = re.match(cls.CUE_TIMINGS_PATTERN, lines[1])
+        match = cls.CUE_TIMINGS_PATTERN.match(lines[1])
         assert match is not None
 
         payload = lines[2:]
@@ -107,22 +109,21 @@ def parse_captions(lines: typing.Sequence[str]) -> typing.List[Caption]:
     :param lines: lines of text
     :returns: list of `Caption` objects
     """
-    captions: typing.List[Caption] = []
+    records = []
 
     for block_lines in utils.iter_blocks_of_lines(lines):
         if not SRTCueBlock.is_valid(block_lines):
             continue
 
         cue_block = SRTCueBlock.from_lines(block_lines)
-        cue_block.start, cue_block.end = map(
-            lambda x: x.replace(',', '.'), (cue_block.start, cue_block.end))
 
-        captions.append(Caption(cue_block.start,
-                                cue_block.end,
-                                cue_block.payload
-                                ))
+        records.append((cue_block.start.replace(',', '.'),
+                        cue_block.end.replace(',', '.'),
+                        cue_block.payload,
+                        None
+                        ))
 
-    return captions
+    return Caption.from_records(records)
 
 
 def write(
@@ -139,9 +140,8 @@ def write(
     for index, caption in enumerate(captions, start=1):
         output.extend([
             f'{index}',
-            '{} --> {}'.format(*map(lambda x: x.replace('.', ','),
-                                    (caption.start, caption.end))
-                               ),
+            f"{caption.start.replace('.', ',')} --> "
+            f"{caption.end.replace('.', ',')}",
             *caption.text.splitlines(),
             ''
             ])
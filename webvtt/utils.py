@@ -11,6 +11,9 @@ CODEC_BOMS = {
     'utf-16-be': codecs.BOM_UTF16_BE
 }
 
+# longest BOMs first, the UTF-32-LE BOM starts with the UTF-16-LE one
+_BOM_ORDER = tuple(sorted(CODEC_BOMS.items(), key=lambda item: -len(item[1])))
+
 
 class FileWrapper:
     """File handling functionality with built-in support for Byte OrderMark."""
@@ -77,7 +80,7 @@ class FileWrapper:
         """
         with open(file_path, mode='rb') as f:
             first_bytes = f.read(4)
-            for encoding, bom in CODEC_BOMS.items():
+            for encoding, bom in _BOM_ORDER:
                 if first_bytes.startswith(bom):
                     return encoding
         return None
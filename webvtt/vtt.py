@@ -1,5 +1,6 @@
 """VTT format module."""
 
+import itertools
 import re
 import typing
 from dataclasses import dataclass
@@ -41,6 +42,8 @@ class ParserOutput:
 class WebVTTCueBlock:
     """Representation of a cue timing block."""
 
+    __slots__ = ('identifier', 'start', 'end', 'payload')
+
     CUE_TIMINGS_PATTERN = re.compile(
         r'\s*((?:\d+:)?\d{2}:\d{2}.\d{3})\s*-->\s*((?:\d+:)?\d{2}:\d{2}.\d{3})'
         )
@@ -75,19 +78,20 @@ class WebVTTCueBlock:
         :param lines: the lines to be validated
         :returns: true for a matching cue time block
         """
-        return bool(
-            (
-              len(lines) >= 2 and
-              re.match(cls.CUE_TIMINGS_PATTERN, lines[0]) and
-              "-->" not in lines[1]
-              ) or
-            (
-              len(lines) >= 3 and
-              "-->" not in lines[0] and
-              re.match(cls.CUE_TIMINGS_PATTERN, lines[1]) and
-              "-->" not in lines[2]
-              )
-        )
+        if len(lines) < 2:
+            return False
+
+        # the arrow tells the timings line from an identifier without
+        # running the pattern on both
+        if '-->' in lines[0]:
+            return bool(cls.CUE_TIMINGS_PATTERN.match(lines[0]) and
+                        '-->' not in lines[1]
+                        )
+
+        return bool(len(lines) >= 3 and
+                    cls.CUE_TIMINGS_PATTERN.match(lines[1]) and
+                    '-->' not in lines[2]
+                    )
 
     @classmethod
     def from_lines(
@@ -106,7 +110,10 @@ class WebVTTCueBlock:
         payload = []
 
         for line in lines:
-            timing_match = re.match(cls.CUE_TIMINGS_PATTERN, line)
+            # the arrow check skips the regex for identifier and text lines
+            timing_match = ('-->' in line and
+                            cls.CUE_TIMINGS_PATTERN.match(line)
+                            )
             if timing_match:
                 start = timing_match.group(1)
                 end = timing_match.group(2)
@@ -127,8 +134,8 @@ class WebVTTCueBlock:
         """
         return [
             '',
-            *(identifier for identifier in {caption.identifier} if identifier),
-            f'{caption.start} --> {caption.end}',
+            *((caption.identifier,) if caption.identifier else ()),
+            f'{caption.start_time} --> {caption.end_time}',
             *caption.lines
         ]
 
@@ -136,6 +143,8 @@ class WebVTTCueBlock:
 class WebVTTCommentBlock:
     """Representation of a comment block."""
 
+    __slots__ = ('text',)
+
     COMMENT_PATTERN = re.compile(r'NOTE\s(.*?)\Z', re.DOTALL)
 
     def __init__(self, text: str):
@@ -192,6 +201,8 @@ class WebVTTCommentBlock:
 class WebVTTStyleBlock:
     """Representation of a style block."""
 
+    __slots__ = ('text',)
+
     STYLE_PATTERN = re.compile(r'STYLE\s(.*?)\Z', re.DOTALL)
 
     def __init__(self, text: str):
@@ -244,18 +255,24 @@ class WebVTTStyleBlock:
 
 
 def parse(
-        lines: typing.Sequence[str]
+        lines: typing.Iterable[str]
         ) -> ParserOutput:
     """
     Parse VTT captions from lines of text.
 
+    The lines are consumed as they are parsed so any iterable works, e.g. a
+    generator reading a file, without holding all the lines in memory.
+
     :param lines: lines of text
     :returns: object `ParserOutput` with all parsed items
     """
-    if not is_valid_content(lines):
+    lines = iter(lines)
+    # only the first line is needed to validate the content
+    header = list(itertools.islice(lines, 1))
+    if not is_valid_content(header):
         raise MalformedFileError('Invalid format')
 
-    return parse_items(lines)
+    return parse_items(itertools.chain(header, lines))
 
 
 def is_valid_content(lines: typing.Sequence[str]) -> bool:
@@ -269,7 +286,7 @@ def is_valid_content(lines: typing.Sequence[str]) -> bool:
 
 
 def parse_items(
-        lines: typing.Sequence[str]
+        lines: typing.Iterable[str]
         ) -> ParserOutput:
     """
     Parse items from the text.
@@ -284,8 +301,9 @@ def parse_items(
     for block_lines in utils.iter_blocks_of_lines(lines):
         item = parse_item(block_lines)
         if item:
-            item.comments = [comment.text for comment in comments]
-            comments = []
+            if comments:
+                item.comments = [comment.text for comment in comments]
+                comments = []
             items.append(item)
         elif WebVTTCommentBlock.is_valid(block_lines):
             comments.append(WebVTTCommentBlock.from_lines(block_lines))
@@ -310,16 +328,18 @@ def parse_item(
     :param lines: lines of text
     :returns: An item (Caption or Style) if found, otherwise None
     """
+    # dispatch on the first line, a valid style block has no timings so it
+    # can never be a cue and the timings regex is skipped for it
+    if lines[0] == 'STYLE' and WebVTTStyleBlock.is_valid(lines):
+        return Style(WebVTTStyleBlock.from_lines(lines).text)
+
     if WebVTTCueBlock.is_valid(lines):
         cue_block = WebVTTCueBlock.from_lines(lines)
-        return Caption(cue_block.start,
-                       cue_block.end,
-                       cue_block.payload,
-                       cue_block.identifier
-                       )
-
-    if WebVTTStyleBlock.is_valid(lines):
-        return Style(WebVTTStyleBlock.from_lines(lines).text)
+        return Caption.from_records([(cue_block.start,
+                                      cue_block.end,
+                                      cue_block.payload,
+                                      cue_block.identifier
+                                      )])[0]
 
     return None
 
@@ -349,6 +369,18 @@ def write(
         )
 
 
+def _extend_comments(output: typing.List[str], comments: typing.Iterable[str]):
+    """
+    Add comment blocks to the output lines.
+
+    :param output: the lines of the output
+    :param comments: the comments
+    """
+    for comment in comments:
+        output.append('')
+        output.extend(WebVTTCommentBlock.format_lines(comment))
+
+
 def to_str(
         captions: typing.Iterable[Caption],
         styles: typing.Iterable[Style],
@@ -366,38 +398,22 @@ def to_str(
     """
     output = ['WEBVTT']
 
-    for comment in header_comments:
-        output.extend([
-            '',
-            *WebVTTCommentBlock.format_lines(comment)
-        ])
+    _extend_comments(output, header_comments)
 
     for style in styles:
-        for comment in style.comments:
-            output.extend([
-                '',
-                *WebVTTCommentBlock.format_lines(comment)
-            ])
-        output.extend([
-            '',
-            *WebVTTStyleBlock.format_lines(style.lines)
-            ])
+        _extend_comments(output, style.comments)
+        output.append('')
+        output.extend(WebVTTStyleBlock.format_lines(style.lines))
 
     for caption in captions:
-        for comment in caption.comments:
-            output.extend([
-                '',
-                *WebVTTCommentBlock.format_lines(comment)
-            ])
+        # most captions have no comments, skip the call for them
+        if caption.has_comments:
+            _extend_comments(output, caption.comments)
         output.extend(WebVTTCueBlock.format_lines(caption))
 
     if not footer_comments:
         output.append('')
 
-    for comment in footer_comments:
-        output.extend([
-            '',
-            *WebVTTCommentBlock.format_lines(comment)
-        ])
+    _extend_comments(output, footer_comments)
 
     return '\n'.join(output)
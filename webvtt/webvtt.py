@@ -136,7 +136,7 @@ class WebVTT:
         _cls = partial(cls, file=getattr(buffer, 'name', None))
 
         if format == 'vtt':
-            output = vtt.parse(cls._get_lines(buffer))
+            output = vtt.parse(cls._iter_lines(buffer))
 
             return _cls(
                 captions=output.captions,
@@ -203,7 +203,8 @@ class WebVTT:
         :param string: the captions in a string
         :returns: a `WebVTT` instance
         """
-        output = vtt.parse(cls._get_lines(string.splitlines()))
+        # splitlines already drops the line breaks, no cleaning needed
+        output = vtt.parse(string.splitlines())
         return cls(
             captions=output.captions,
             styles=output.styles,
@@ -211,15 +212,30 @@ class WebVTT:
             footer_comments=output.footer_comments
         )
 
-    @staticmethod
-    def _get_lines(lines: typing.Iterable[str]) -> typing.List[str]:
+    @classmethod
+    def _get_lines(cls, lines: typing.Iterable[str]) -> typing.List[str]:
         """
         Return cleaned lines from an iterable of lines.
 
         :param lines: iterable of lines
         :returns: a list of cleaned lines
         """
-        return [line.rstrip('\n\r') for line in lines]
+        return list(cls._iter_lines(lines))
+
+    @staticmethod
+    def _iter_lines(
+            lines: typing.Iterable[str]
+            ) -> typing.Generator[str, None, None]:
+        """
+        Iterate cleaned lines from an iterable of lines.
+
+        Unlike `_get_lines` the lines are not collected in a list so parsers
+        can consume a file while it is being read.
+
+        :param lines: iterable of lines
+        :returns: generator of cleaned lines
+        """
+        return (line.rstrip('\n\r') for line in lines)
 
     def _get_destination_file(
             self,